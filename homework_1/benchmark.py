@@ -0,0 +1,165 @@
+import os
+import datetime
+from collections import deque
+from zoneinfo import ZoneInfo
+import pwd
+import grp
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+
+from dz1_1 import Manager
+from dz1_2 import Manipulator
+
+
+def measure(action: Callable[[], object]) -> float:
+    """
+    runs the action once
+    :param action: function without arguments
+    :return: elapsed time in seconds
+    """
+    start = time.perf_counter()
+    action()
+    return time.perf_counter() - start
+
+
+def log_names(amount: int) -> List[str]:
+    return [f"file_{number}.log" for number in range(amount)]
+
+
+def touch_each(file_names: List[str], path: str):
+    for file_name in file_names:
+        Manager.executor(["touch", os.path.join(path, file_name)])
+
+
+def bench_create_files(amount: int):
+    file_names = log_names(amount)
+    with tempfile.TemporaryDirectory() as per_file_dir, tempfile.TemporaryDirectory() as pool_dir, \
+            tempfile.TemporaryDirectory() as bulk_dir:
+        per_file = measure(lambda: touch_each(file_names, per_file_dir))
+        pool = measure(lambda: Manager.run_commands([["touch", name] for name in file_names], cwd=pool_dir))
+        bulk = measure(lambda: Manager.bulk_create_files(file_names, bulk_dir))
+        assert sorted(os.listdir(per_file_dir)) == sorted(os.listdir(pool_dir)) == sorted(os.listdir(bulk_dir))
+    print(f"create {amount} files: touch per file {per_file:.3f}s, touch in pool {pool:.3f}s, "
+          f"bulk {bulk:.3f}s, x{per_file / bulk:.0f}")
+
+
+def bench_change_owners(amount: int):
+    user_owners, group_owners = pwd.getpwuid(os.getuid()).pw_name, grp.getgrgid(os.getgid()).gr_name
+    with tempfile.TemporaryDirectory() as path:
+        Manager.bulk_create_files(log_names(amount), path)
+        owners = f"{user_owners}:{group_owners}"
+        per_file = measure(lambda: [Manager.executor(["chown", owners, os.path.join(path, name)])
+                                    for name in os.listdir(path)])
+        worker = Manager(path)
+        bulk = measure(lambda: worker.bulk_change_owners(user_owners, group_owners))
+    print(f"chown {amount} files: chown per file {per_file:.3f}s, bulk {bulk:.3f}s, x{per_file / bulk:.0f}")
+
+
+def bench_parallel_managers(workers: int):
+    """
+    several managers work in their own directories from parallel threads,
+    the process working directory must stay the same
+    """
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as path:
+        managers = [Manager(os.path.join(path, f"dz1_{number}")) for number in range(workers)]
+        for worker in managers:
+            os.mkdir(worker.get_path_working_directory())
+
+        def job(worker: Manager) -> int:
+            worker.create_files(bulk=True)
+            created = len(worker.get_files(worker.get_path_working_directory()))
+            report = worker.delete_random_files(3)
+            return created - len(report["deleted"])
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            start = time.perf_counter()
+            left = list(pool.map(job, managers))
+            elapsed = time.perf_counter() - start
+        expected = [len(list(Manager.date_generator())) - 3] * workers
+        assert left == expected, left
+        assert [len(os.listdir(worker.get_path_working_directory())) for worker in managers] == expected
+    assert os.getcwd() == cwd
+    print(f"{workers} managers in parallel threads: {elapsed:.3f}s")
+
+
+def bench_date_range(step: str, amount: int):
+    start = datetime.datetime(2000, 1, 1)
+    end = start + datetime.timedelta(**{f"{step}s": amount})
+    for template, timezone in (("{0.day}-{0.month}-{0.year}.log", None),
+                               ("{0:%d-%m-%Y_%H}.log", ZoneInfo("Europe/Berlin"))):
+        elapsed = measure(lambda: deque(Manager.date_range(start, end, step, template, timezone), maxlen=0))
+        zone = timezone or "naive"
+        print(f"date_range {amount} {step}s {template} {zone}: {amount / elapsed:,.0f} names/s")
+
+
+def rewrite_in_memory(file_name: str, shebang: str = "#!/usr/bin/python3"):
+    with open(file_name, "r") as f:
+        temp_data = f.read()
+    with open(file_name, "w") as f:
+        f.writelines(shebang + "\n")
+        f.write(temp_data)
+
+
+def bench_shebang(size_mb: int):
+    line = "print('hello')  # " + "x" * 45 + "\n"
+    results = {}
+    with tempfile.TemporaryDirectory() as path:
+        for title, action in (("in memory", rewrite_in_memory), ("streaming", Manipulator.add_shebang)):
+            file_name = os.path.join(path, "script.py")
+            with open(file_name, "w") as f:
+                for _ in range(size_mb * 1024 * 1024 // len(line)):
+                    f.write(line)
+            tracemalloc.start()
+            elapsed = measure(lambda: action(file_name))
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            results[title] = f"{elapsed:.3f}s, peak {peak / 1024 / 1024:.1f} MB"
+    print(f"shebang on {size_mb} MB: " + ", ".join(f"{title} {result}" for title, result in results.items()))
+
+
+def copy_with_processes(name_files: List[str]):
+    for name_file in name_files:
+        new_name = Manipulator.run_name(name_file)
+        Manager.executor(["cp", name_file, new_name])
+        rewrite_in_memory(new_name)
+        Manager.executor(["chmod", "500", new_name])
+
+
+def bench_manipulator(amount: int, size_kb: int):
+    with tempfile.TemporaryDirectory() as path:
+        name_files = []
+        for number in range(amount):
+            name_files.append(os.path.join(path, f"script_{number}.py"))
+            with open(name_files[-1], "w") as f:
+                f.write("print('hello')\n" * (size_kb * 1024 // 15))
+        processes = measure(lambda: copy_with_processes(name_files))
+        for name_file in name_files:
+            os.unlink(Manipulator.run_name(name_file))
+        timing = {}
+        batch = measure(lambda: timing.update(Manipulator().process_files(name_files)))
+    copy = sum(result["copy"] for result in timing.values()) / amount  # type: ignore
+    print(f"runnable copies of {amount} scripts of {size_kb} KB: cp and chmod processes {processes:.3f}s, "
+          f"batch {batch:.3f}s, mean copy {copy * 1000:.2f}ms")
+
+
+def main():
+    bench_date_range("hour", 1_000_000)
+    bench_date_range("day", 100_000)
+
+    for amount in (31, 365, 2000):
+        bench_create_files(amount)
+    if os.geteuid() == 0:
+        for amount in (31, 365, 2000):
+            bench_change_owners(amount)
+    bench_parallel_managers(8)
+    for size_mb in (10, 300):
+        bench_shebang(size_mb)
+    bench_manipulator(200, 64)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,9 +1,31 @@
 import os
+import pwd
+import grp
+import time
 import subprocess
 import calendar
 import datetime
-from typing import Union
-from random import sample
+from typing import Union, Iterable, Iterator, Dict, List, NamedTuple, Optional
+from random import randrange
+from concurrent.futures import ThreadPoolExecutor
+
+
+DATE_STEPS: Dict[str, datetime.timedelta] = {
+    "hour": datetime.timedelta(hours=1),
+    "day": datetime.timedelta(days=1),
+    "week": datetime.timedelta(weeks=1),
+}
+
+
+class CommandResult(NamedTuple):
+    """
+    Outcome of a command launched by Manager.run_commands
+    """
+    command: Union[str, list]
+    returncode: int
+    stdout: str
+    stderr: str
+    seconds: float
 
 
 class Manager:
@@ -13,81 +35,301 @@ class Manager:
 
     def __init__(self, working_directory: str):
         """
-        :param working_directory: directory name for main job
+        :param working_directory: directory name for main job,
+            it is resolved once, the process working directory is never changed
         """
         self._working_directory = working_directory
+        self._path = os.path.abspath(working_directory)
 
     def get_name_working_directory(self) -> str:
         return self._working_directory
 
+    def get_path_working_directory(self) -> str:
+        return self._path
+
     def checking_work_directory(self):
-        return os.path.exists(self._working_directory)
-
-    def _switch_working_directory(self):
-        os.chdir(self._working_directory) if self.checking_work_directory() else print("Directory not created")
-
-    def _level_up_directory(self):
-        os.chdir("..") if os.getcwd().split("/")[-1] == self._working_directory else print("Can't work, I'm not your directory") # noqa
-
-    def create_files(self):
-        self._switch_working_directory()
-        file_names = self.get_files(".")
-        if os.getcwd().split("/")[-1] == self._working_directory and len(file_names) == 0:
-            for current_day in self.date_generator():
-                file_name = current_day + ".log"
-                self.executor(["touch", file_name])
-            self._level_up_directory()
+        return os.path.isdir(self._path)
+
+    def create_files(self, bulk: bool = False, file_names: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """
+        creates a log file for each day of the current month
+        :param bulk: create all files in-process instead of running touch for each file
+        :param file_names: names to create instead of the days of the current month, for example from date_range
+        :return: files that could not be created with the reason
+        """
+        failures: Dict[str, str] = {}
+        if not self.checking_work_directory():
+            print("Directory not created")
+        elif len(self.get_files(self._path)) == 0:
+            if file_names is None:
+                file_names = (current_day + ".log" for current_day in self.date_generator())
+            if bulk:
+                failures = self.bulk_create_files(file_names, self._path)
+            else:
+                orders = [["touch", file_name] for file_name in file_names]
+                for result in self.run_commands(orders, cwd=self._path):
+                    if result.returncode != 0:
+                        failures[result.command[-1]] = result.stderr.strip()
         else:
             print("Files not created")
-            self._level_up_directory()
+        return failures
 
-    def change_owners(self, user_owners: str, group_owners: str, type_work: str):
-        if type_work == "files":
-            self._switch_working_directory()
-            file_names = self.get_files(".")
+    @staticmethod
+    def bulk_create_files(file_names: Iterable[str], path: str = ".") -> Dict[str, str]:
+        """
+        works like touch, but without starting a process for each file,
+        names are resolved against a descriptor of the directory
+        :param file_names: names of files to be created or updated
+        :param path: directory in which the files are located
+        :return: files that could not be created with the reason
+        """
+        failures: Dict[str, str] = {}
+        directory = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            for file_name in file_names:
+                try:
+                    descriptor = os.open(file_name, os.O_WRONLY | os.O_CREAT, 0o666, dir_fd=directory)
+                except OSError as error:
+                    failures[file_name] = error.strerror
+                    continue
+                try:
+                    os.utime(descriptor)
+                except OSError as error:
+                    failures[file_name] = error.strerror
+                finally:
+                    os.close(descriptor)
+        finally:
+            os.close(directory)
+        return failures
+
+    def change_owners(self, user_owners: str, group_owners: str, type_work: str, bulk: bool = False):
+        """
+        changes the owner of the files, the directory or both
+        :param user_owners: new owner
+        :param group_owners: new group
+        :param type_work: "files", "directory" or "recursive" for the directory with all its contents
+        :param bulk: for "files", change all files in batches instead of a process per file
+        """
+        if type_work == "recursive" or (type_work == "files" and bulk):
+            if self.checking_work_directory():
+                self.bulk_change_owners(user_owners, group_owners, recursive=type_work == "recursive")
+            else:
+                print("No directory, I can't work")
+        elif type_work == "files":
+            file_names = self.get_files(self._path) if self.checking_work_directory() else []
             if len(file_names) > 0:
+                # sudo may ask for the password, so one process at a time with the prompt visible
                 for file_name in file_names:
-                    self.executor(["sudo", "-S", "chown", f"{user_owners}:{group_owners}", f"{file_name}"])
+                    self.executor(["sudo", "-S", "chown", f"{user_owners}:{group_owners}",
+                                   os.path.join(self._path, file_name)])
             else:
                 print("No files, can't work")
-            self._level_up_directory()
         elif type_work == "directory":
             check: bool = self.checking_work_directory()
             if check:
-                directory_name = self.get_name_working_directory()
-                self.executor(["sudo", "-S", "chown", f"{user_owners}:{group_owners}", f"{directory_name}"])
+                self.executor(["sudo", "-S", "chown", f"{user_owners}:{group_owners}", f"{self._path}"])
             else:
                 print("No directory, I can't work")
         else:
             print("type of work unknown, can't work")
 
-    def delete_random_files(self):
+    def bulk_change_owners(self, user_owners: str, group_owners: str, recursive: bool = True,
+                           dry_run: bool = False) -> Dict[str, Union[int, float]]:
+        """
+        changes owners with os.chown when the process has privileges,
+        otherwise with as few sudo chown calls as the ARG_MAX limit allows
+        :param user_owners: new owner
+        :param group_owners: new group
+        :param recursive: also the directory itself and everything in subdirectories, otherwise only files
+        :param dry_run: only count the entries that would be changed
+        :return: number of changed entries, of entries that could not be changed, elapsed seconds
+        and whether it was a dry run
+        """
+        start = time.perf_counter()
+        paths = self._walk_paths(recursive)
+        count, failed = 0, 0
+        if dry_run:
+            count = sum(1 for _ in paths)
+        elif os.geteuid() == 0:
+            try:
+                uid, gid = pwd.getpwnam(user_owners).pw_uid, grp.getgrnam(group_owners).gr_gid
+            except KeyError as error:
+                print(f"Unknown owner {error}")
+                return {"entries": 0, "failed": 0, "seconds": time.perf_counter() - start, "dry_run": dry_run}
+            for path in paths:
+                try:
+                    os.chown(path, uid, gid, follow_symlinks=False)
+                    count += 1
+                except OSError as error:
+                    failed += 1
+                    print(error)
+        else:
+            order = ["sudo", "-S", "chown", "-h", f"{user_owners}:{group_owners}", "--"]
+            for chunk in self.chunk_arguments(order, paths):
+                # the output is not captured, sudo has to show its password prompt
+                result = self.run_command(chunk, capture_output=False)
+                if result.returncode == 0:
+                    count += len(chunk) - len(order)
+                else:
+                    failed += len(chunk) - len(order)
+                    print(f"chown of {len(chunk) - len(order)} entries failed with code {result.returncode}"
+                          f"{': ' + result.stderr.strip() if result.stderr else ''}")
+        elapsed = time.perf_counter() - start
+        action = "Would change" if dry_run else "Changed"
+        print(f"{action} owners of {count} entries in {elapsed:.3f}s" + (f", {failed} failed" if failed else ""))
+        return {"entries": count, "failed": failed, "seconds": elapsed, "dry_run": dry_run}
+
+    def _walk_paths(self, recursive: bool) -> Iterator[str]:
+        if not recursive:
+            with os.scandir(self._path) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        yield entry.path
+            return
+        yield self._path
+        for root, directories, files in os.walk(self._path):
+            for name in directories + files:
+                yield os.path.join(root, name)
+
+    @staticmethod
+    def chunk_arguments(order: List[str], arguments: Iterable[str], limit: int = 0) -> Iterator[List[str]]:
+        """
+        splits a long list of arguments into several commands, each fits into ARG_MAX
+        :param order: command with options, repeated in each chunk
+        :param arguments: arguments to be distributed among the commands
+        :param limit: maximum size of the command line in bytes, by default ARG_MAX without the environment
+        :return: commands ready to be executed
+        """
+        def weight(argument: str) -> int:
+            # the string itself, its terminating zero and a pointer in argv
+            return len(os.fsencode(argument)) + 1 + 8
+
+        if not limit:
+            environment = sum(weight(key) + weight(value) for key, value in os.environ.items())
+            limit = os.sysconf("SC_ARG_MAX") - environment - 4096
+        base = sum(weight(argument) for argument in order)
+        chunk: List[str] = []
+        size = base
+        for argument in arguments:
+            if chunk and size + weight(argument) > limit:
+                yield order + chunk
+                chunk, size = [], base
+            chunk.append(argument)
+            size += weight(argument)
+        if chunk:
+            yield order + chunk
+
+    def delete_random_files(self, amount: int = 5) -> Dict[str, Union[List[str], Dict[str, str]]]:
+        """
+        deletes random files from the working directory,
+        the directory is read as a stream, so only the chosen names are kept in memory
+        :param amount: how many files to delete
+        :return: deleted files and files that could not be deleted with the reason
+        """
+        report: Dict[str, Union[List[str], Dict[str, str]]] = {"deleted": [], "failed": {}}
         check: bool = self.checking_work_directory()
         if check:
-            self._switch_working_directory()
-            file_names = self.get_files(".")
-            try:
-                victims = sample(file_names, 5)
-                order = ["sudo", "-S", "rm", *victims]
-                self.executor(order)
-                print("Files have been deleted: {}".format(" ".join(victims)))
-            except ValueError:
+            victims = self.sample_files(self._path, amount)
+            if amount < 1 or len(victims) < amount:
                 print("No data to work")
-            finally:
-                self._level_up_directory()
+                return report
+            report = self.remove_files(os.path.join(self._path, victim) for victim in victims)
         else:
             print("No working directory")
+        return report
+
+    @staticmethod
+    def sample_files(path: str, amount: int) -> List[str]:
+        """
+        chooses random file names with reservoir sampling over os.scandir
+        :param path: directory with files
+        :param amount: size of the sample
+        :return: no more than amount names
+        """
+        reservoir: List[str] = []
+        with os.scandir(path) as entries:
+            seen = 0
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                seen += 1
+                if len(reservoir) < amount:
+                    reservoir.append(entry.name)
+                else:
+                    position = randrange(seen)
+                    if position < amount:
+                        reservoir[position] = entry.name
+        return reservoir
+
+    def remove_files(self, paths: Iterable[str]) -> Dict[str, Union[List[str], Dict[str, str]]]:
+        """
+        removes files in-process, files without access are removed with batched sudo rm
+        :param paths: paths of the files
+        :return: deleted files and files that could not be deleted with the reason
+        """
+        deleted: List[str] = []
+        failed: Dict[str, str] = {}
+        forbidden: List[str] = []
+        for path in paths:
+            try:
+                os.unlink(path)
+                deleted.append(path)
+            except PermissionError:
+                forbidden.append(path)
+            except OSError as error:
+                failed[path] = error.strerror
+        order = ["sudo", "-S", "rm", "-f", "--"]
+        for chunk in self.chunk_arguments(order, forbidden):
+            self.executor(chunk)
+        for path in forbidden:
+            if os.path.lexists(path):
+                failed[path] = "Permission denied"
+            else:
+                deleted.append(path)
+        return {"deleted": deleted, "failed": failed}
 
     @staticmethod
     def get_files(path: str) -> list:
         return os.listdir(path=path)
 
-    @staticmethod
-    def date_generator():
+    @classmethod
+    def date_generator(cls) -> Iterator[str]:
         date = datetime.datetime.now()
         last_day = calendar.monthrange(date.year, date.month)[1]
-        for day in range(1, last_day):
-            yield f"{day}-{date.month}-{date.year}"
+        start = datetime.datetime(date.year, date.month, 1)
+        return cls.date_range(start, start + datetime.timedelta(days=last_day))
+
+    @staticmethod
+    def date_range(start: datetime.datetime, end: datetime.datetime, step: str = "day",
+                   template: str = "{0.day}-{0.month}-{0.year}",
+                   timezone: Optional[datetime.tzinfo] = None) -> Iterator[str]:
+        """
+        lazily yields names for moments from start to end, end is not included
+        :param start: first moment, naive values are taken in timezone
+        :param end: moment at which the range stops
+        :param step: "hour", "day" or "week"; hours are counted in real time, days and weeks by the calendar
+        :param template: format string, the moment is its only argument: "{0.day}-{0.month}-{0.year}.log",
+            "{0:%d-%m-%Y_%H}.log"
+        :param timezone: zone in which the names are formed, by default the zone of start
+        :return: generator of names
+        """
+        if step not in DATE_STEPS:
+            raise ValueError(f"Unknown step {step}, expected one of: {', '.join(DATE_STEPS)}")
+        if timezone is not None:
+            start, end = (moment.replace(tzinfo=timezone) if moment.tzinfo is None else moment.astimezone(timezone)
+                          for moment in (start, end))
+        delta, name = DATE_STEPS[step], template.format
+        if step == "hour" and start.tzinfo is not None:
+            local_zone = start.tzinfo
+            current, end = start.astimezone(datetime.timezone.utc), end.astimezone(datetime.timezone.utc)
+            while current < end:
+                yield name(current.astimezone(local_zone))
+                current += delta
+        else:
+            current = start
+            while current < end:
+                yield name(current)
+                current += delta
 
     @staticmethod
     def executor(commands: Union[str, list]):
@@ -101,6 +343,41 @@ class Manager:
             print(error)
             print("Incorrect data, enter the correct command")
 
+    @staticmethod
+    def run_command(command: Union[str, list], timeout: Optional[float] = None,
+                    cwd: Optional[str] = None, capture_output: bool = True) -> CommandResult:
+        """
+        executes a command and captures its output
+        :param command: can be represented as a string or a list of strings
+        :param timeout: seconds after which the command is killed
+        :param cwd: directory in which the command is run
+        :param capture_output: False leaves the output on the terminal, for commands that ask something
+        :return: exit code, output and wall time of the command
+        """
+        start = time.perf_counter()
+        try:
+            completed = subprocess.run(command, capture_output=capture_output, text=True, timeout=timeout, cwd=cwd)
+            returncode, stdout, stderr = completed.returncode, completed.stdout or "", completed.stderr or ""
+        except subprocess.TimeoutExpired as error:
+            returncode, stdout, stderr = -1, "", str(error)
+        except OSError as error:
+            returncode, stdout, stderr = 127, "", str(error)
+        return CommandResult(command, returncode, stdout, stderr, time.perf_counter() - start)
+
+    @classmethod
+    def run_commands(cls, commands: Iterable[Union[str, list]], limit: Optional[int] = None,
+                     timeout: Optional[float] = None, cwd: Optional[str] = None) -> List[CommandResult]:
+        """
+        executes independent commands simultaneously, but no more than limit at a time
+        :param commands: commands in the same form as for executor
+        :param limit: maximum number of running processes, by default the number of processors
+        :param timeout: seconds after which each command is killed
+        :param cwd: directory in which the commands are run
+        :return: results in the order of the commands
+        """
+        with ThreadPoolExecutor(max_workers=limit or os.cpu_count()) as pool:
+            return list(pool.map(lambda command: cls.run_command(command, timeout, cwd), commands))
+
 
 def main():
     worker = Manager("dz1")
@@ -108,10 +385,15 @@ def main():
     worker.executor("pwd")
     folder = worker.get_name_working_directory()
     worker.executor(["mkdir", "-p", folder])
-    worker.create_files()
-    worker.change_owners("root", "root", "files")
-    worker.change_owners("root", "root", "directory")
-    worker.delete_random_files()
+    failures = worker.create_files(bulk=True)
+    for file_name, reason in failures.items():
+        print(f"File {file_name} not created: {reason}")
+    worker.change_owners("root", "root", "recursive")
+    report = worker.delete_random_files()
+    if report["deleted"]:
+        print("Files have been deleted: {}".format(" ".join(report["deleted"])))
+    for file_name, reason in report["failed"].items():  # type: ignore
+        print(f"File {file_name} not deleted: {reason}")
 
 
 if __name__ == '__main__':
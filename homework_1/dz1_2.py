@@ -1,36 +1,172 @@
+import os
+import shutil
+import tempfile
+import time
 import subprocess
+from typing import Dict, Iterable, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
 
 
 class Manipulator:
 
-    __ward_file: str = ""
+    def __init__(self):
+        self.__ward_file: str = ""
+        self.__ward_files: List[str] = []
 
     def _rec_ward_name(self, ward_name: str):
         self.__ward_file = ward_name
+        self.__ward_files.append(ward_name)
+
+    def get_ward_files(self) -> List[str]:
+        return list(self.__ward_files)
 
     def copy_file(self, name_file):
-        new_name: str = name_file.split('.')[0] + "_run.py"
-        subprocess.run(["cp", f"{name_file}", f"{new_name}"])
+        new_name: str = self.run_name(name_file)
+        self.copy_contents(name_file, new_name)
         self._rec_ward_name(new_name)
 
+    @staticmethod
+    def run_name(name_file: str) -> str:
+        return os.path.splitext(name_file)[0] + "_run.py"
+
+    @staticmethod
+    def copy_contents(source_name: str, target_name: str):
+        """
+        copies a file inside the kernel: copy_file_range, then sendfile, then an ordinary chunked copy
+        :param source_name: file to be copied
+        :param target_name: new file, the mode is copied too
+        """
+        with open(source_name, "rb") as source, open(target_name, "wb") as target:
+            offset, size = 0, os.fstat(source.fileno()).st_size
+            try:
+                while offset < size:
+                    copied = os.copy_file_range(source.fileno(), target.fileno(), size - offset, offset)
+                    if copied == 0:
+                        break
+                    offset += copied
+            except (AttributeError, OSError):
+                try:
+                    while offset < size:
+                        sent = os.sendfile(target.fileno(), source.fileno(), offset, size - offset)
+                        if sent == 0:
+                            break
+                        offset += sent
+                except OSError:
+                    pass
+            if offset < size:
+                source.seek(offset)
+                target.seek(offset)
+                shutil.copyfileobj(source, target, 1024 * 1024)
+        shutil.copymode(source_name, target_name)
+
     def make_shell_accessible(self):
         wizardry_bash = "#!/usr/bin/python3"
         if self.__ward_file:
-            with open(self.__ward_file, "r") as f:
-                temp_data = f.read()
-            with open(self.__ward_file, "w") as f:
-                f.writelines(wizardry_bash + "\n")
-                f.write(temp_data)
+            self.add_shebang(self.__ward_file, wizardry_bash)
         else:
             print("Can't work")
 
+    @staticmethod
+    def add_shebang(file_name: str, shebang: str = "#!/usr/bin/python3") -> bool:
+        """
+        writes the shebang and then the contents, copied by the kernel, into a temporary file
+        next to the original and atomically replaces the original with it;
+        a symlink is followed and keeps pointing to the script, owner, group and mode are kept
+        :param file_name: script to be changed
+        :param shebang: first line of the script
+        :return: False if the script already starts with a shebang or has other hard links
+        """
+        file_name = os.path.realpath(file_name)
+        with open(file_name, "rb") as source:
+            if source.read(2) == b"#!":
+                return False
+            status = os.fstat(source.fileno())
+            if status.st_nlink > 1:
+                # the other names would keep the old contents
+                print(f"{file_name} has {status.st_nlink} hard links, the shebang is not added")
+                return False
+            source.seek(0)
+            directory = os.path.dirname(os.path.abspath(file_name))
+            descriptor, temp_name = tempfile.mkstemp(prefix=".", suffix=".tmp", dir=directory)
+            try:
+                with os.fdopen(descriptor, "wb") as target:
+                    target.write(shebang.encode() + b"\n")
+                    target.flush()
+                    try:
+                        offset, size = 0, status.st_size
+                        while offset < size:
+                            sent = os.sendfile(target.fileno(), source.fileno(), offset, size - offset)
+                            if sent == 0:
+                                break
+                            offset += sent
+                    except OSError:
+                        source.seek(offset)
+                        shutil.copyfileobj(source, target, 1024 * 1024)
+                    target.flush()
+                    os.fsync(target.fileno())
+                # run with sudo the temporary file belongs to root, the script must stay with its owner
+                if (status.st_uid, status.st_gid) != (os.getuid(), os.getgid()):
+                    os.chown(temp_name, status.st_uid, status.st_gid)
+                shutil.copymode(file_name, temp_name)
+                os.replace(temp_name, file_name)
+            except BaseException:
+                os.unlink(temp_name)
+                raise
+        directory_descriptor = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(directory_descriptor)
+        finally:
+            os.close(directory_descriptor)
+        return True
+
     def setting_permissions(self):
         if self.__ward_file:
             print(self.__ward_file)
-            subprocess.run(["sudo", "-S", "chmod", "500", self.__ward_file])
+            self.change_mode(self.__ward_file)
         else:
             print("Can't work")
 
+    @staticmethod
+    def change_mode(file_name: str, mode: int = 0o500):
+        """
+        the owner can read and run the file, the rest have no access;
+        sudo is only called when the process is not allowed to do it itself
+        """
+        try:
+            os.chmod(file_name, mode)
+        except PermissionError:
+            subprocess.run(["sudo", "-S", "chmod", f"{mode:o}", file_name])
+
+    def process_files(self, name_files: Iterable[str],
+                      workers: Optional[int] = None) -> Dict[str, Dict[str, Union[float, str]]]:
+        """
+        makes runnable copies of many scripts in a thread pool: copy, shebang, permissions
+        :param name_files: scripts to be copied
+        :param workers: number of threads, by default chosen by ThreadPoolExecutor
+        :return: for each script the seconds spent on each stage or the error
+        """
+        def process(name_file: str) -> Dict[str, Union[float, str]]:
+            timing: Dict[str, Union[float, str]] = {}
+            new_name = self.run_name(name_file)
+            stages = (("copy", lambda: self.copy_contents(name_file, new_name)),
+                      ("shebang", lambda: self.add_shebang(new_name)),
+                      ("permissions", lambda: self.change_mode(new_name)))
+            start = time.perf_counter()
+            try:
+                for stage, action in stages:
+                    stage_start = time.perf_counter()
+                    action()
+                    timing[stage] = time.perf_counter() - stage_start
+                self._rec_ward_name(new_name)
+            except OSError as error:
+                timing["error"] = str(error)
+            timing["total"] = time.perf_counter() - start
+            return timing
+
+        names = list(name_files)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return dict(zip(names, pool.map(process, names)))
+
 
 def main():
     manipulator = Manipulator()
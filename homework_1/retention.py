@@ -0,0 +1,194 @@
+import os
+import re
+import gzip
+import time
+import shutil
+import datetime
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Tuple, Union
+
+from dz1_1 import Manager
+
+
+LOG_NAME = re.compile(r"(\d{1,2})-(\d{1,2})-(\d{4})\.log(\.gz)?")
+
+
+class LogRetention:
+    """
+    Keeps the dd-mm-yyyy.log directory of a Manager within age and size limits
+    """
+
+    def __init__(self, manager: Manager, delete_after: Optional[datetime.timedelta] = None,
+                 compress_after: Optional[datetime.timedelta] = None, max_size: Optional[int] = None,
+                 batch_size: int = 100):
+        """
+        :param manager: owner of the log directory
+        :param delete_after: files older than this are deleted
+        :param compress_after: files older than this are compressed with gzip
+        :param max_size: the oldest files are deleted while the directory is bigger, bytes
+        :param batch_size: how many files are processed in one batch
+        """
+        self._manager = manager
+        self._path = manager.get_path_working_directory()
+        self._delete_after = delete_after
+        self._compress_after = compress_after
+        self._max_size = max_size
+        self._batch_size = batch_size
+        # sorted by date: every log file and only the uncompressed ones
+        self._index: List[Tuple[datetime.date, str]] = []
+        self._plain: List[Tuple[datetime.date, str]] = []
+        self._sizes: Dict[str, int] = {}
+        self._total_size = 0
+        self._directory_mtime: Optional[int] = None
+
+    @staticmethod
+    def parse_date(file_name: str) -> Optional[datetime.date]:
+        match = LOG_NAME.fullmatch(file_name)
+        if match is None:
+            return None
+        day, month, year = (int(part) for part in match.group(1, 2, 3))
+        try:
+            return datetime.date(year, month, day)
+        except ValueError:
+            return None
+
+    def get_total_size(self) -> int:
+        return self._total_size
+
+    def get_files(self) -> List[str]:
+        return [name for _, name in self._index]
+
+    def _add(self, date: datetime.date, name: str, size: int):
+        insort(self._index, (date, name))
+        if not name.endswith(".gz"):
+            insort(self._plain, (date, name))
+        self._sizes[name] = size
+        self._total_size += size
+
+    def _discard(self, name: str):
+        date = self.parse_date(name)
+        for index in (self._index, self._plain):
+            position = bisect_left(index, (date, name))
+            if position < len(index) and index[position] == (date, name):
+                del index[position]
+        self._total_size -= self._sizes.pop(name, 0)
+
+    def refresh(self) -> bool:
+        """
+        updates the index, the directory is listed only when its mtime has changed,
+        only new files are examined, the newest file is checked each time since it may be growing
+        :return: whether the directory was listed
+        """
+        if self._index:
+            newest = self._index[-1][1]
+            try:
+                size = os.stat(os.path.join(self._path, newest)).st_size
+                self._total_size += size - self._sizes[newest]
+                self._sizes[newest] = size
+            except FileNotFoundError:
+                pass
+        mtime = os.stat(self._path).st_mtime_ns
+        if mtime == self._directory_mtime:
+            return False
+        present = set()
+        with os.scandir(self._path) as entries:
+            for entry in entries:
+                present.add(entry.name)
+                if entry.name in self._sizes:
+                    continue
+                date = self.parse_date(entry.name)
+                if date is not None and entry.is_file(follow_symlinks=False):
+                    self._add(date, entry.name, entry.stat(follow_symlinks=False).st_size)
+        for name in [name for name in self._sizes if name not in present]:
+            self._discard(name)
+        self._directory_mtime = mtime
+        return True
+
+    def _compress(self, name: str) -> int:
+        source = os.path.join(self._path, name)
+        target = source + ".gz"
+        with open(source, "rb") as f_in, gzip.open(target + ".tmp", "wb") as f_out:
+            shutil.copyfileobj(f_in, f_out)
+        shutil.copystat(source, target + ".tmp")
+        os.replace(target + ".tmp", target)
+        os.unlink(source)
+        return os.stat(target).st_size
+
+    def enforce(self, today: Optional[datetime.date] = None) -> Dict[str, Union[List[str], Dict[str, str]]]:
+        """
+        applies the limits to the indexed files, oldest first, in batches
+        :param today: date from which the age is counted
+        :return: deleted, compressed files and files that could not be processed with the reason
+        """
+        today = today or datetime.date.today()
+        report: Dict[str, Union[List[str], Dict[str, str]]] = {"deleted": [], "compressed": [], "failed": {}}
+        failed: Dict[str, str] = report["failed"]  # type: ignore
+
+        def delete(names: List[str]):
+            for start in range(0, len(names), self._batch_size):
+                batch = names[start:start + self._batch_size]
+                result = self._manager.remove_files(os.path.join(self._path, name) for name in batch)
+                for path in result["deleted"]:
+                    name = os.path.basename(path)
+                    self._discard(name)
+                    report["deleted"].append(name)  # type: ignore
+                for path, reason in result["failed"].items():  # type: ignore
+                    failed[os.path.basename(path)] = reason
+
+        if self._delete_after is not None:
+            border = bisect_left(self._index, (today - self._delete_after,))
+            delete([name for _, name in self._index[:border] if name not in failed])
+        if self._compress_after is not None:
+            border = bisect_left(self._plain, (today - self._compress_after,))
+            for date, name in self._plain[:border]:
+                if name in failed:
+                    continue
+                try:
+                    size = self._compress(name)
+                except OSError as error:
+                    failed[name] = error.strerror
+                    continue
+                self._discard(name)
+                # an older archive of the same name has just been replaced
+                self._discard(name + ".gz")
+                self._add(date, name + ".gz", size)
+                report["compressed"].append(name)  # type: ignore
+        if self._max_size is not None:
+            victims, excess = [], self._total_size - self._max_size
+            for _, name in self._index:
+                if excess <= 0:
+                    break
+                if name not in failed:
+                    victims.append(name)
+                    excess -= self._sizes[name]
+            delete(victims)
+        return report
+
+    def watch(self, interval: float = 60, ticks: Optional[int] = None):
+        """
+        polls the directory and applies the limits
+        :param interval: seconds between ticks
+        :param ticks: number of ticks, endless by default
+        """
+        tick = 0
+        while ticks is None or tick < ticks:
+            self.refresh()
+            report = self.enforce()
+            for key in ("deleted", "compressed"):
+                if report[key]:
+                    print("Files have been {}: {}".format(key, " ".join(report[key])))
+            for file_name, reason in report["failed"].items():  # type: ignore
+                print(f"File {file_name} not processed: {reason}")
+            tick += 1
+            if ticks is None or tick < ticks:
+                time.sleep(interval)
+
+
+def main():
+    retention = LogRetention(Manager("dz1"), delete_after=datetime.timedelta(days=90),
+                             compress_after=datetime.timedelta(days=7), max_size=1024 ** 3)
+    retention.watch()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,204 @@
+import os
+import time
+import tempfile
+import tracemalloc
+from typing import Callable, Iterator, List
+
+from hw3 import Url, GoogleUrl, WikiUrl, HttpsUrl, UrlCreator
+from url_store import UrlStore
+
+
+def measure(action: Callable[[], object], repeat: int) -> float:
+    """
+    :param action: function without arguments
+    :param repeat: how many times to run it
+    :return: runs per second
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        action()
+    return repeat / (time.perf_counter() - start)
+
+
+class FormerUrl:
+    """
+    the former layout of Url: components and the string in a per-instance __dict__
+    """
+
+    def __init__(self, url: Url):
+        self._scheme = url._scheme
+        self._authority = url._authority
+        self._path = url._path
+        self._query = url._query
+        self._fragment = url._fragment
+        self._url = url._url
+
+
+def slotted_copy(url: Url) -> Url:
+    """
+    the same Url sharing the strings, so only the instance itself is measured
+    """
+    clone = object.__new__(Url)
+    for name in Url.__slots__:
+        object.__setattr__(clone, name, getattr(url, name))
+    return clone
+
+
+class ConcatenatedUrl(Url):
+    """
+    the former way of building: everything is validated again and the string grows with += part by part
+    """
+    __slots__ = ()
+
+    def _create_url(self):
+        url = self._schema_validation(self._scheme)
+        url += self._analysis_authority(self._authority)
+        if self._path:
+            url += "/"
+            if isinstance(self._path, tuple):
+                url += "/".join(self._path)
+            elif "/" in self._path and len(self._path) > 1:
+                url += "/".join([elem for elem in self._path.split("/") if elem != ""])
+            else:
+                url += self._path
+        if self._query:
+            url += "?"
+            if isinstance(self._query, str):
+                url += self._query
+            else:
+                count = len(self._query)
+                for key, value in self._query.items():
+                    url += f"{key}={value}"
+                    if count > 1:
+                        url += "&"
+                        count -= 1
+        if self._fragment:
+            url += f"#{self._fragment}"
+        object.__setattr__(self, "_url", url)
+
+
+CASES = [
+    {"scheme": "https", "authority": "google.com"},
+    {"scheme": "https", "authority": "google.com", "query": {"q": "python", "result": "json"}},
+    {"scheme": "https", "authority": "wikipedia.org", "path": ["wiki", "python"]},
+    {"scheme": "http", "authority": "localhost:5000", "path": "/api//v1/users/", "fragment": "top"},
+    {"scheme": "http", "authority": "localhost:port", "path": "/", "query": "a=1"},
+    {"scheme": "https", "authority": "example.com", "query": {f"key{n}": n for n in range(1000)}},
+]
+
+
+def check_identical_output():
+    for case in CASES:
+        assert Url(**case) == str(ConcatenatedUrl(**case)), case
+    assert GoogleUrl() == HttpsUrl(authority="google.com") == "https://google.com"
+    assert WikiUrl(path=["wiki", "python"]) == "https://wikipedia.org/wiki/python"
+
+
+def instance_size(build: Callable[[int], object], amount: int = 100_000) -> float:
+    """
+    :param build: makes an instance from a number
+    :return: bytes taken by one instance, strings and path parts of the url included
+    """
+    tracemalloc.start()
+    instances: List[object] = [build(number) for number in range(amount)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del instances
+    return size / amount
+
+
+def bench_memory():
+    urls = [WikiUrl(path=["wiki", f"page_{number}"]) for number in range(100_000)]
+    slotted = instance_size(lambda number: slotted_copy(urls[number]))
+    former = instance_size(lambda number: FormerUrl(urls[number]))
+    print(f"memory per url instance without its strings: slotted {slotted:.0f} B, former __dict__ {former:.0f} B")
+    dedupe = measure(lambda: len(set(urls)), 10)
+    print(f"set of {len(urls):,} urls: {dedupe:.1f}/s")
+
+
+def traced_size(build: Callable[[], object]) -> int:
+    tracemalloc.start()
+    built = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del built
+    return size
+
+
+def bench_store(amount: int = 200_000):
+    def texts() -> Iterator[str]:
+        for number in range(amount):
+            yield str(WikiUrl(path=["wiki", f"topic_{number % 100}", f"page_{number // 100}"]))
+
+    strings = traced_size(lambda: set(texts()))
+    store = traced_size(lambda: UrlStore(texts()))
+    print(f"{amount:,} urls: set of strings {strings / 1024 / 1024:.1f} MB, UrlStore {store / 1024 / 1024:.1f} MB")
+    urls = UrlStore(texts())
+    lookup = measure(lambda: "https://wikipedia.org/wiki/topic_45/page_123" in urls, 100_000)
+    under = measure(lambda: sum(1 for _ in urls.prefix("https://wikipedia.org/wiki/topic_7/")), 10)
+    print(f"UrlStore: membership {lookup:,.0f}/s, prefix of {amount // 100:,} urls {under:.1f}/s")
+
+
+def bench_sitemap(amount: int = 1_000_000):
+    def paths() -> Iterator[list]:
+        return (["wiki", f"page_{number}"] for number in range(amount))
+
+    def queries() -> Iterator[dict]:
+        return ({"lang": "en", "rev": number} for number in range(amount))
+
+    def by_objects(f):
+        for path, query in zip(paths(), queries()):
+            f.write(str(Url("https", "wikipedia.org", path, query)) + "\n")
+
+    def in_bulk(f):
+        f.writelines(Url.build_many("https", "wikipedia.org", paths(), queries(), end="\n"))
+
+    ready = list(Url.build_many("https", "wikipedia.org", paths(), queries(), end="\n"))
+
+    def only_writing(f):
+        f.writelines(ready)
+
+    with tempfile.TemporaryDirectory() as path:
+        results = {}
+        for title, write in (("Url per row", by_objects), ("build_many", in_bulk), ("writing only", only_writing)):
+            with open(os.path.join(path, "sitemap.txt"), "w") as f:
+                results[title] = measure(lambda: write(f), 1) * amount
+    print(f"sitemap of {amount:,} urls: " + ", ".join(f"{title} {speed:,.0f}/s" for title, speed in results.items()))
+
+
+def bench_parse(amount: int = 1_000_000, distinct: int = 3000):
+    texts = list(Url.build_many("https", "wikipedia.org", (["wiki", f"page_{number % distinct}"]
+                                                            for number in range(amount))))
+    Url.parse.cache_clear()
+    uncached = measure(lambda: [Url.parse.__wrapped__(text) for text in texts[:amount // 10]], 1) * (amount // 10)
+    cached = measure(lambda: [Url.parse(text) for text in texts], 1) * amount
+    print(f"parse {amount:,} log urls, {distinct:,} distinct: without cache {uncached:,.0f}/s, "
+          f"with cache {cached:,.0f}/s, {Url.parse.cache_info()}")
+
+
+def bench_creator():
+    users = UrlCreator("https", "api.x").v1.users
+    fresh = measure(lambda: UrlCreator("https", "api.x").v1.users.profile._create(), 100_000)
+    kept = measure(lambda: users.profile._create(), 100_000)
+    called = measure(lambda: users("42").profile._create(), 100_000)
+    print(f"UrlCreator: new chain {fresh:,.0f}/s, kept prefix {kept:,.0f}/s, kept prefix with an id {called:,.0f}/s")
+
+
+def main():
+    check_identical_output()
+    for case in CASES:
+        repeat = 100 if len(case.get("query", "")) > 10 else 100_000
+        before = measure(lambda: ConcatenatedUrl(**case), repeat)
+        after = measure(lambda: Url(**case), repeat)
+        title = str(Url(**case))[:60]
+        print(f"{title:60} += {before:>10,.0f}/s, Url {after:>10,.0f}/s")
+    bench_memory()
+    bench_store()
+    bench_sitemap()
+    bench_parse()
+    bench_creator()
+    print(f"{'GoogleUrl(query=...)':60} Url {measure(lambda: GoogleUrl(query={'q': 'python'}), 100_000):>10,.0f}/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,13 @@
-from typing import Union
+import copy
+import pickle
+from typing import Union, Iterable, Iterator, List, Optional, Tuple
+from functools import lru_cache
+from itertools import chain, repeat
+
+
+PARSE_CACHE_SIZE = 8192
+# one element chained after each column of build_many, reaching it means the column ended
+_END = (object(),)
 
 
 class UrlFormatError(Exception):
@@ -15,93 +24,203 @@ class UrlFormatError(Exception):
 
 class Url:
     """
-    Implements a URL string that is a pointer to a resource
+    Implements a URL string that is a pointer to a resource,
+    immutable and hashable like the string itself, so it can be a set element or a dict key
     """
+    __slots__ = ("_scheme", "_authority", "_path", "_query", "_fragment", "_url", "_hash")
     __reserved_schemes: list = ["http", "https"]
-    _url: str = ""
 
-    def __init__(self, scheme: str, authority: str, path: Union[str, list] = "", query: Union[str, dict] = "",
-                 fragment: str = ""):
-        self._scheme = scheme
-        self._authority = authority
-        self._path = path
-        self._query = query
-        self._fragment = fragment
+    def __init__(self, scheme: str, authority: str, path: Union[str, list, tuple] = "",
+                 query: Union[str, dict] = "", fragment: str = ""):
+        set_attribute = object.__setattr__
+        set_attribute(self, "_scheme", scheme)
+        set_attribute(self, "_authority", authority)
+        set_attribute(self, "_path", tuple(path) if isinstance(path, list) else path)
+        set_attribute(self, "_query", query)
+        set_attribute(self, "_fragment", fragment)
         self._create_url()
+        set_attribute(self, "_hash", hash(self._url))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __setstate__(self, state):
+        """
+        copy and pickle restore the slots past the immutability guard,
+        the hash is taken again because string hashes differ between processes
+        """
+        _, slots = state if isinstance(state, tuple) else (None, state)
+        for name, value in (slots or {}).items():
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, "_hash", hash(self._url))
 
     def __eq__(self, other):
-        return self._url == other
+        if isinstance(other, Url):
+            return self._hash == other._hash and self._url == other._url
+        if isinstance(other, str):
+            return self._url == other
+        return NotImplemented
+
+    def __hash__(self):
+        return self._hash
 
     def __str__(self):
         return self._url
 
-    def _schema_validation(self):
-        if self._scheme in self.__reserved_schemes:
-            self._url += f"{self._scheme}://"
-        else:
-            raise UrlFormatError(self._scheme)
+    def __repr__(self):
+        return f"{type(self).__name__}({self._url!r})"
 
-    def _analysis_authority(self):
+    @staticmethod
+    def _schema_validation(scheme: str) -> str:
+        if scheme in Url.__reserved_schemes:
+            return f"{scheme}://"
+        raise UrlFormatError(scheme)
+
+    @staticmethod
+    def _analysis_authority(authority: str) -> str:
         separator, ban = ":", "!@#$%^&*()+_"
-        if any((mark in ban) for mark in self._authority):
-            raise UrlFormatError(self._authority)
+        if any((mark in ban) for mark in authority):
+            raise UrlFormatError(authority)
 
-        if separator in self._authority and self._authority.count(separator) == 1:
-            aut_data: list = self._authority.split(separator)
+        if separator in authority and authority.count(separator) == 1:
+            aut_data: list = authority.split(separator)
             if aut_data[-1].isdigit():
-                self._url += f"{aut_data[0]}{separator}{aut_data[-1]}"
-        else:
-            self._url += f"{self._authority}"
+                return f"{aut_data[0]}{separator}{aut_data[-1]}"
+            return ""
+        return authority
 
-        if self._path:
-            self._url += "/"
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _prefix(scheme: str, authority: str) -> str:
+        """
+        scheme and authority are validated once for each pair,
+        urls of one site (GoogleUrl, WikiUrl) reuse the ready beginning
+        """
+        return Url._schema_validation(scheme) + Url._analysis_authority(authority)
+
+    @staticmethod
+    def split(text: str) -> Tuple[str, str, Optional[List[str]], str]:
+        """
+        splits a url string the way Url builds it
+        :param text: url string
+        :return: scheme, authority, path segments (None when there is no path) and the rest: ?query#fragment
+        """
+        scheme, separator, rest = text.partition("://")
+        if not separator:
+            raise UrlFormatError(text)
+        authority_end = len(rest)
+        for mark in "/?#":
+            position = rest.find(mark, 0, authority_end)
+            if position != -1:
+                authority_end = position
+        authority, rest = rest[:authority_end], rest[authority_end:]
+        tail_start = len(rest)
+        for mark in "?#":
+            position = rest.find(mark, 0, tail_start)
+            if position != -1:
+                tail_start = position
+        path, tail = rest[:tail_start], rest[tail_start:]
+        return scheme, authority, path[1:].split("/") if path else None, tail
+
+    @staticmethod
+    @lru_cache(maxsize=PARSE_CACHE_SIZE)
+    def parse(text: str) -> "Url":
+        """
+        turns a url string back into components, str of the result is the same string;
+        results are kept in an LRU cache, Url.parse.cache_info() shows hits and misses
+        :param text: url string
+        :return: Url
+        """
+        scheme, authority, segments, tail = Url.split(text)
+        query, _, fragment = tail[1:].partition("#") if tail.startswith("?") else ("", "", tail[1:])
+        return Url(scheme, authority, segments if segments is not None else "", query, fragment)
+
+    @classmethod
+    def build_many(cls, scheme: str, authority: str, paths: Iterable[Union[str, list, tuple]],
+                   queries: Optional[Iterable[Union[str, dict]]] = None, fragments: Optional[Iterable[str]] = None,
+                   end: str = "") -> Iterator[str]:
+        """
+        builds url strings from columns without creating Url objects,
+        scheme and authority are validated once for the whole stream
+        :param scheme: common scheme
+        :param authority: common authority
+        :param paths: path of each url, the columns are read in parallel and must have the same length
+        :param queries: query of each url
+        :param fragments: fragment of each url
+        :param end: appended to each string, "\n" to write lines straight into a file
+        :return: generator of url strings
+        :raises ValueError: when a column ends before the others, after the urls of the complete rows
+        """
+        prefix = cls._prefix(scheme, authority)
+        build_path, build_query = cls._build_path, cls._build_query
+        # every given column ends with the marker, all of them must reach it on the same row
+        end_mark = _END[0]
+        for path, query, fragment in zip(chain(paths, _END), repeat("") if queries is None else chain(queries, _END),
+                                         repeat("") if fragments is None else chain(fragments, _END)):
+            if path is end_mark or query is end_mark or fragment is end_mark:
+                if not (path is end_mark and (queries is None or query is end_mark)
+                        and (fragments is None or fragment is end_mark)):
+                    raise ValueError("build_many: the columns have different lengths")
+                return
+            parts = [prefix]
+            if path:
+                parts.append("/")
+                parts.append(build_path(path))
+            if query:
+                parts.append(build_query(query))
+            if fragment:
+                parts.append("#")
+                parts.append(fragment)
+            parts.append(end)
+            yield "".join(parts)
 
-    def _build_path(self):
+    @staticmethod
+    def _build_path(path: Union[str, list, tuple]) -> str:
         separator = "/"
-        if isinstance(self._path, list):
-            self._url += "/".join(self._path)
-        elif isinstance(self._path, str):
-            if separator in self._path and len(self._path) > 1:
-                self._url += "/".join([elem for elem in self._path.split(separator) if elem != ""])
-            else:
-                self._url += self._path
-
-    def _build_query(self):
+        if isinstance(path, (list, tuple)):
+            return separator.join(path)
+        if isinstance(path, str):
+            if separator in path and len(path) > 1:
+                return separator.join([elem for elem in path.split(separator) if elem != ""])
+            return path
+        return ""
+
+    @staticmethod
+    def _build_query(query: Union[str, dict]) -> str:
         separator, query_start = "&", "?"
-        self._url += query_start
-        if isinstance(self._query, str):
-            self._url += f"{self._query}"
-        elif isinstance(self._query, dict):
-            count: int = len(self._query.items())
-            for current_key, current_value in self._query.items():
-                self._url += f"{current_key}={current_value}"
-                if count > 1:
-                    self._url += separator
-                    count -= 1
-        else:
-            raise UrlFormatError(str(self._query))
-
-    def _build_fragment(self):
+        if isinstance(query, str):
+            return query_start + query
+        if isinstance(query, dict):
+            return query_start + separator.join([f"{key}={value}" for key, value in query.items()])
+        raise UrlFormatError(str(query))
+
+    @staticmethod
+    def _build_fragment(fragment: str) -> str:
         fragment_start = "#"
-        self._url += f"{fragment_start}{self._fragment}"
+        return fragment_start + fragment
 
     def _create_url(self):
         """
         builds url string, a pointer to a resource
-        _url - will receive a string
+        _url - will receive a string, the parts are collected and joined once
         do not change the order in which functions are run
         """
-        self._schema_validation()
-        self._analysis_authority()
+        parts: list = [self._prefix(self._scheme, self._authority)]
         if self._path:
-            self._build_path()
+            parts.append("/")
+            parts.append(self._build_path(self._path))
         if self._query:
-            self._build_query()
+            parts.append(self._build_query(self._query))
         if self._fragment:
-            self._build_fragment()
+            parts.append(self._build_fragment(self._fragment))
+        object.__setattr__(self, "_url", "".join(parts))
 
 
 class HttpsUrl(Url):
+    __slots__ = ()
     __scheme = "https"
 
     def __init__(self, authority: str, path: Union[str, list] = "", query: Union[str, dict] = "", fragment: str = ""):
@@ -109,6 +228,7 @@ class HttpsUrl(Url):
 
 
 class HttpUrl(Url):
+    __slots__ = ()
     __scheme = "http"
 
     def __init__(self, authority: str, path: Union[str, list] = "", query: Union[str, dict] = "", fragment: str = ""):
@@ -116,6 +236,7 @@ class HttpUrl(Url):
 
 
 class GoogleUrl(Url):
+    __slots__ = ()
     __scheme = "https"
     __authority = "google.com"
 
@@ -124,6 +245,7 @@ class GoogleUrl(Url):
 
 
 class WikiUrl(Url):
+    __slots__ = ()
     __scheme = "https"
     __authority = "wikipedia.org"
 
@@ -131,6 +253,76 @@ class WikiUrl(Url):
         super().__init__(scheme=self.__scheme, authority=self.__authority, path=path, query=query, fragment=fragment)
 
 
+class UrlCreator:
+    """
+    Creates Url step by step: UrlCreator("https", "api.x").v1.users("42")._create();
+    every step is a new creator that only points to its parent, so a prefix is built once and can be kept,
+    attribute steps of a creator are remembered and each creator makes its Url once
+    """
+    __slots__ = ("_scheme", "_authority", "_parent", "_step", "_query", "_children", "_url")
+
+    def __init__(self, scheme: str, authority: str):
+        self._scheme = scheme
+        self._authority = authority
+        self._parent: Optional[UrlCreator] = None
+        self._step = ""
+        self._query: dict = {}
+        self._children: dict = {}
+        self._url: Optional[Url] = None
+
+    def _extend(self, step: str, query: Optional[dict] = None) -> "UrlCreator":
+        creator = UrlCreator.__new__(UrlCreator)
+        creator._scheme, creator._authority, creator._parent = self._scheme, self._authority, self
+        creator._step, creator._query = step, self._query if query is None else {**self._query, **query}
+        creator._children, creator._url = {}, None
+        return creator
+
+    def __getattr__(self, name: str) -> "UrlCreator":
+        if name.startswith("_"):
+            raise AttributeError(name)
+        child = self._children.get(name)
+        if child is None:
+            child = self._children[name] = self._extend(name)
+        return child
+
+    def __call__(self, *args, **kwargs) -> "UrlCreator":
+        """
+        steps from call arguments are not remembered, they are usually different every time
+        :param args: path steps
+        :param kwargs: query parameters
+        """
+        creator = self
+        for step in args:
+            creator = creator._extend(str(step))
+        if kwargs:
+            creator = creator._extend("", kwargs)
+        return creator
+
+    def _path(self) -> List[str]:
+        path: List[str] = []
+        creator: Optional[UrlCreator] = self
+        while creator is not None:
+            if creator._step:
+                path.append(creator._step)
+            creator = creator._parent
+        path.reverse()
+        return path
+
+    def _create(self) -> Url:
+        if self._url is None:
+            self._url = Url(self._scheme, self._authority, self._path(), self._query)
+        return self._url
+
+    def __eq__(self, other):
+        return self._create() == other
+
+    def __hash__(self):
+        return hash(self._create())
+
+    def __str__(self):
+        return str(self._create())
+
+
 # === GoogleUrl test ==
 assert GoogleUrl() == HttpsUrl(authority="google.com")
 assert GoogleUrl() == Url(scheme="https", authority="google.com")
@@ -141,3 +333,31 @@ assert GoogleUrl(query={'q': 'python', 'result': 'json'}) == 'https://google.com
 assert WikiUrl() == str(Url(scheme='https', authority='wikipedia.org'))
 assert WikiUrl(path=['wiki', 'python']) == 'https://wikipedia.org/wiki/python'
 # ===
+# === build_many test ==
+assert list(Url.build_many("https", "wikipedia.org", ["", ["wiki", "python"]], [{"a": 1}, ""])) == \
+    ["https://wikipedia.org?a=1", str(WikiUrl(path=["wiki", "python"]))]
+try:
+    list(Url.build_many("https", "wikipedia.org", ["a", "b"], ["q=1"]))
+    assert False, "a short column was not noticed"
+except ValueError:
+    pass
+# ===
+# === parse test ==
+assert Url.parse("https://wikipedia.org/wiki/python?a=1#top") == WikiUrl(path=["wiki", "python"], query="a=1",
+                                                                         fragment="top")
+assert Url.parse("https://google.com?q=python&result=json") is Url.parse("https://google.com?q=python&result=json")
+# ===
+# === UrlCreator test ==
+url_creator = UrlCreator(scheme="https", authority="docs.python.org")
+assert url_creator.docs.v1.api.list == "https://docs.python.org/docs/v1/api/list"
+assert url_creator("api", "v1", "list") == "https://docs.python.org/api/v1/list"
+assert url_creator("3").search(q="getattr", area="default")._create() == \
+       "https://docs.python.org/3/search?q=getattr&area=default"
+assert url_creator.docs is url_creator.docs and url_creator.docs._create() is url_creator.docs._create()
+# ===
+# === hash test ==
+assert len({GoogleUrl(), HttpsUrl(authority="google.com"), "https://google.com"}) == 1
+assert {WikiUrl(): "wiki"}["https://wikipedia.org"] == "wiki"
+assert copy.copy(GoogleUrl()) == GoogleUrl() and type(copy.deepcopy(GoogleUrl())) is GoogleUrl
+assert pickle.loads(pickle.dumps(WikiUrl(path=["wiki", "python"]))) == "https://wikipedia.org/wiki/python"
+# ===
@@ -0,0 +1,177 @@
+import sys
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from hw3 import Url, UrlFormatError, WikiUrl
+
+
+def merge_tails(tails: Union[str, Set[str], None], tail: str) -> Union[str, Set[str], None]:
+    """
+    almost every url has a single ending, a set is only made for several
+    :return: tails with the tail added or None if it is already there
+    """
+    if tails is None:
+        return sys.intern(tail)
+    if isinstance(tails, str):
+        return None if tails == tail else {tails, tail}
+    if tail in tails:
+        return None
+    tails.add(tail)
+    return tails
+
+
+def normalize_tail(tail: str) -> str:
+    """
+    Url drops an empty query or fragment, so "?" and "#" alone are dropped here as well
+    :param tail: ?query#fragment part of a url string
+    :return: the tail as Url would build it
+    """
+    if not tail:
+        return tail
+    query, _, fragment = tail[1:].partition("#") if tail.startswith("?") else ("", "", tail[1:])
+    return (f"?{query}" if query else "") + (f"#{fragment}" if fragment else "")
+
+
+class UrlStore:
+    """
+    Set of urls, scheme and authority are stored once per site, paths as a trie of segments;
+    a node is a dict of segments, a node without children is just the ?query#fragment endings of its urls
+    """
+    # key under which a node with children keeps the endings of the urls ending at it
+    __end = None
+
+    def __init__(self, urls: Iterable[Union[Url, str]] = ()):
+        self._roots: Dict[Tuple[str, str], dict] = {}
+        self._size = 0
+        self.update(urls)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, url) -> bool:
+        if not isinstance(url, (Url, str)):
+            return False
+        try:
+            scheme, authority, segments, tail = Url.split(str(url))
+        except UrlFormatError:
+            return False
+        tail = normalize_tail(tail)
+        tails = self._tails(self._find(self._roots.get((scheme, authority)), segments or ()))
+        if tails is None:
+            return False
+        return tail == tails if isinstance(tails, str) else tail in tails
+
+    def __iter__(self) -> Iterator[Url]:
+        for (scheme, authority), root in self._roots.items():
+            yield from self._walk(scheme, authority, root, None)
+
+    @staticmethod
+    def _find(node, segments: Iterable[str]):
+        for segment in segments:
+            if not isinstance(node, dict):
+                return None
+            node = node.get(segment)
+        return node
+
+    def _tails(self, node):
+        return node.get(self.__end) if isinstance(node, dict) else node
+
+    def add(self, url: Union[Url, str]) -> bool:
+        """
+        :param url: Url or url string
+        :return: False if the url was already stored
+        :raises UrlFormatError: when Url could not be made of the string
+        """
+        scheme, authority, segments, tail = Url.split(str(url))
+        # the urls are rebuilt on iteration, a string Url rejects must not get in
+        if Url._prefix(scheme, authority) != f"{scheme}://{authority}":
+            raise UrlFormatError(authority)
+        tail = normalize_tail(tail)
+        key = (sys.intern(scheme), sys.intern(authority))
+        node = self._roots.get(key)
+        if node is None:
+            node = self._roots[key] = {}
+        slot = self.__end
+        if segments:
+            for segment in segments[:-1]:
+                child = node.get(segment)
+                if not isinstance(child, dict):
+                    child = node[sys.intern(segment)] = {} if child is None else {self.__end: child}
+                node = child
+            slot = sys.intern(segments[-1])
+            if isinstance(node.get(slot), dict):
+                node, slot = node[slot], self.__end
+        tails = merge_tails(node.get(slot), tail)
+        if tails is None:
+            return False
+        node[slot] = tails
+        self._size += 1
+        return True
+
+    def update(self, urls: Iterable[Union[Url, str]]):
+        for url in urls:
+            self.add(url)
+
+    def prefix(self, text: str) -> Iterator[Url]:
+        """
+        lazily yields the stored urls whose string starts with text
+        :param text: beginning of a url, for example "https://wikipedia.org/wiki/"
+        """
+        try:
+            scheme, authority, segments, tail = Url.split(text)
+        except UrlFormatError:
+            segments, tail = None, ""
+        if segments is None and not tail:
+            for (root_scheme, root_authority), root in self._roots.items():
+                if f"{root_scheme}://{root_authority}".startswith(text):
+                    yield from self._walk(root_scheme, root_authority, root, None)
+            return
+        full_segments = (segments or []) if tail else segments[:-1]  # type: ignore
+        node = self._find(self._roots.get((scheme, authority)), full_segments)
+        if node is None:
+            return
+        if tail:
+            for url in self._walk(scheme, authority, self._tails(node) or {}, segments):
+                if str(url).startswith(text):
+                    yield url
+        elif isinstance(node, dict):
+            partial = segments[-1]  # type: ignore
+            for segment, child in node.items():
+                if segment is not self.__end and segment.startswith(partial):
+                    yield from self._walk(scheme, authority, child, full_segments + [segment])
+
+    def _walk(self, scheme: str, authority: str, node, path: Optional[List[str]]) -> Iterator[Url]:
+        """
+        :param node: dict of segments or bare endings
+        :param path: segments leading to the node, None for a site without a path
+        """
+        stack = [(node, path)]
+        while stack:
+            node, path = stack.pop()
+            tails = self._tails(node)
+            if tails is not None:
+                for tail in (tails,) if isinstance(tails, str) else sorted(tails):
+                    query, _, fragment = tail[1:].partition("#") if tail.startswith("?") else ("", "", tail[1:])
+                    yield Url(scheme, authority, path if path is not None else "", query, fragment)
+            if isinstance(node, dict):
+                for segment, child in reversed(list(node.items())):
+                    if segment is not self.__end:
+                        stack.append((child, (path or []) + [segment]))
+
+
+# === UrlStore test ==
+store = UrlStore(["https://wikipedia.org/wiki/python?a=1", "https://wikipedia.org/wiki/pyramid",
+                  "https://wikipedia.org/a", "https://wikipedia.org/a/b", "https://x.com/a?"])
+assert WikiUrl(path=["wiki", "python"], query="a=1") in store and "https://wikipedia.org/wiki/pyramid" in store
+assert "https://wikipedia.org/wiki" not in store and "https://wikipedia.org/wiki/python" not in store
+assert "https://wikipedia.org/a" in store and "https://wikipedia.org/a/b" in store
+assert list(store.prefix("https://wikipedia.org/wiki/")) == ["https://wikipedia.org/wiki/python?a=1",
+                                                             "https://wikipedia.org/wiki/pyramid"]
+assert list(store.prefix("https://wikipedia.org/wiki/python?a")) == ["https://wikipedia.org/wiki/python?a=1"]
+assert "https://x.com/a?" in store and list(store.prefix("https://x.com")) == ["https://x.com/a"]
+assert not store.add("https://x.com/a") and len(store) == 5
+try:
+    store.add("ftp://x")
+    assert False, "ftp://x was stored"
+except UrlFormatError:
+    pass
+# ===
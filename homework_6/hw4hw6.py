@@ -2,10 +2,18 @@ from flask import Flask, request
 from time import strftime
 from typing import Dict, Tuple, Any, Union
 from werkzeug.datastructures import CombinedMultiDict
-from random import choice
+from random import choices
 
 
 app = Flask(__name__)
+ALPHABET: str = "abcdefghijklmnopqrstuvwxyz"
+SPECIAL_CHARS: str = '!"№;%:?*()_+'
+NUMBERS: str = "0123456789"
+# alphabet for every combination of (specials, digits), made once
+ALPHABETS: Dict[Tuple[bool, bool], str] = {
+    (specials, digits): ALPHABET + (SPECIAL_CHARS if specials else "") + (NUMBERS if digits else "")
+    for specials in (False, True) for digits in (False, True)
+}
 
 
 @app.route("/whoami")
@@ -46,11 +54,6 @@ def random_sequence() -> str:
     :return: string of random chars or an empty string
     """
     result: str = ""
-    data_work: Dict[str, str] = {
-        "alphabet": "abcdefghijklmnopqrstuvwxyz",
-        "special_chars": '!"№;%:?*()_+',
-        "numbers": "0123456789"
-    }
     reserved_keys: Tuple[str, str, str] = ("length", "specials", "digits")
     request_data: CombinedMultiDict = request.values
     if request_data:
@@ -72,17 +75,9 @@ def random_sequence() -> str:
         def build_sequence() -> str:
             length: int = sequence_settings.get(reserved_keys[0], 0)
             if 1 <= length <= 100:
-                sequence_string, spirit_string = "", ""
                 specials: int = sequence_settings.get(reserved_keys[1], 0)
                 digits: int = sequence_settings.get(reserved_keys[2], 0)
-                spirit_string += data_work["alphabet"]
-                if specials:
-                    spirit_string += data_work["special_chars"]
-                if digits:
-                    spirit_string += data_work["numbers"]
-                for _ in range(length):
-                    sequence_string += choice(spirit_string)
-                return sequence_string
+                return "".join(choices(ALPHABETS[bool(specials), bool(digits)], k=length))
             else:
                 return ""
         result = build_sequence()
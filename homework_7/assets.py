@@ -141,4 +141,34 @@ def big_txt():
             font-size: 20px;
         }
     
-    """
\ No newline at end of file
+    """
+
+
+def page(element_head, navigation_bar, content) -> str:
+    """
+    Whole page: head, navigation and the content of the description block
+    :param element_head: Elements to be inserted into the head, title and styles
+    :param navigation_bar: site menu
+    :param content: markup of the description block
+    :return: string with html document
+    """
+    return f"""
+    <!doctype html>
+    <html lang="en">
+        {head(element_head)}
+        <body>
+        <header class="header">
+            {navigation_bar}
+        </header>
+        <section class="section">
+            <div class="container">
+                <div class="wrap">
+                    <div class="description">
+                        {content}
+                    </div>
+                </div>
+            </div>
+        </section>
+      </body>
+    </html>
+    """
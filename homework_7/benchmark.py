@@ -0,0 +1,203 @@
+import os
+import sys
+import time
+from time import strftime
+from typing import Callable, Dict, Tuple
+
+from markupsafe import escape
+
+from random import choice, choices
+
+import assets
+import compression
+import hw7
+import loadtest
+import sequence
+
+
+def measure(action: Callable[[], object], repeat: int = 10_000) -> float:
+    """
+    :param action: function without arguments
+    :param repeat: how many times to run it
+    :return: microseconds per run
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        action()
+    return (time.perf_counter() - start) / repeat * 10 ** 6
+
+
+def assemble_whoami(blank: Dict[str, str]) -> bytes:
+    """
+    the former way: head and the whole page are assembled with f-strings on each request,
+    values are escaped as the template does
+    """
+    blank = {key: escape(value) for key, value in blank.items()}
+    head_insert = f"""
+            <title>Homework 7 Whoami</title>
+            {hw7.COMMON_STYLES}
+        """
+    return f"""
+    <!doctype html>
+    <html lang="en">
+        {assets.head(head_insert)}
+        <body>
+        <header class="header">
+            {hw7.NAVIGATION["nav"]}
+        </header>
+        <section class="section">
+            <div class="container">
+                <div class="wrap">
+                    <div class="description">
+                        <h2>Data about you</h2>
+                        <div>Your browser: <b>{blank["browser"]}</b><div>
+                        <div>Your IP address: <b>{blank["ip"]}</b><div>
+                        <div>Time to receive: <b>{blank["time"]}</b><div>
+                    </div>
+                </div>
+            </div>
+        </section>
+      </body>
+    </html>
+    """.encode()
+
+
+def bench_render():
+    blank = {"browser": "Firefox", "ip": "127.0.0.1", "time": "12:00:00"}
+    before = measure(lambda: assemble_whoami(blank))
+    after = measure(lambda: hw7.WHOAMI_PAGE.render(**blank))
+    print(f"whoami page render: f-strings {before:.2f} us, template {after:.2f} us")
+    before = measure(lambda: hw7.index.__wrapped__())
+    print(f"index page render: template without the cache {before:.2f} us")
+
+
+def former_client_data(environ: dict) -> Tuple[str, str, str]:
+    """
+    the former way: the User-Agent of each request is parsed and the time is formatted
+    """
+    client = hw7.app.request_class(environ)
+    browser = client.user_agent.browser
+    return browser.capitalize() if browser else "undefined", client.remote_addr or "undefined", strftime("%H:%M:%S")
+
+
+def bench_whoami(repeat: int = 20_000):
+    agent = "Mozilla/5.0 (X11; Linux x86_64; rv:120.0) Gecko/20100101 Firefox/120.0"
+    with hw7.app.test_request_context("/whoami", headers={"User-Agent": agent}):
+        environ = hw7.request.environ
+        before = measure(lambda: former_client_data(environ), repeat)
+        after = measure(hw7.client_data, repeat)
+    client = hw7.app.test_client()
+    page = measure(lambda: client.get("/whoami", headers={"User-Agent": agent}).data, 2000)
+    data = measure(lambda: client.get("/whoami.json", headers={"User-Agent": agent}).data, 2000)
+    print(f"whoami data: parsing and formatting {before:.2f} us, cached {after:.2f} us; "
+          f"/whoami {page:.1f} us, /whoami.json {data:.1f} us per request")
+
+
+def bench_compression(repeat: int = 5000):
+    pages = {
+        "whoami": (hw7.WHOAMI_PAGE, {"browser": "Firefox", "ip": "127.0.0.1", "time": "12:00:00"}),
+        "random": (hw7.RANDOM_PAGE, {"length": 42, "specials": 1, "digits": 0,
+                                     "result": sequence.build_sequence(42, True, False)}),
+    }
+    for title, (template, values) in pages.items():
+        plain = template.render(**values)
+        spliced = template.render_encoded("gzip", **values)
+        whole = compression.compress("gzip", plain)
+        identity = measure(lambda: template.render(**values), repeat)
+        splice_time = measure(lambda: template.render_encoded("gzip", **values), repeat)
+        whole_time = measure(lambda: compression.compress("gzip", template.render(**values)), repeat)
+        print(f"{title} page: identity {len(plain)} B {identity:.1f} us, "
+              f"spliced gzip {len(spliced)} B {splice_time:.1f} us, whole gzip {len(whole)} B {whole_time:.1f} us")
+
+
+def bench_routes():
+    client = hw7.app.test_client()
+    for url in ("/", "/whoami", "/source_code", "/random?length=42&specials=1&digits=0"):
+        print(f"{url:40} {measure(lambda: client.get(url), 2000):8.1f} us per request")
+
+
+def bench_source_code(requests: int = 2000):
+    client = hw7.app.test_client()
+    rendered_before = hw7.PAGE_CACHE.stats()["misses"]
+    cached = measure(lambda: client.get("/source_code", headers={"Accept-Encoding": "gzip"}), requests)
+    reads = hw7.PAGE_CACHE.stats()["misses"] - rendered_before
+    with hw7.app.test_request_context("/source_code"):
+        uncached = measure(lambda: hw7.source_code.__wrapped__(), requests)
+    print(f"/source_code x{requests}: file read {reads:.0f} times, {cached:.1f} us per request, "
+          f"reading and rendering the page alone takes {uncached:.1f} us")
+
+
+def loop_sequence(length: int, alphabet: str) -> str:
+    """
+    the former way: a choice call per character and a growing string
+    """
+    sequence_string = ""
+    for _ in range(length):
+        sequence_string += choice(alphabet)
+    return sequence_string
+
+
+def bench_sequence(length: int = 1_000_000):
+    alphabet = sequence.ALPHABETS[True, True]
+    results = {
+        "choice loop": measure(lambda: loop_sequence(length, alphabet), 3),
+        "random.choices": measure(lambda: "".join(choices(alphabet, k=length)), 3),
+        "random.randbytes table": measure(lambda: sequence.build_sequence(length, True, True), 3),
+        "os.urandom table": measure(lambda: sequence.build_sequence(length, True, True, secure=True), 3),
+        "stream, secure": measure(lambda: sum(map(len, sequence.stream_sequence(length, True, True, True))), 3),
+    }
+    print(f"sequence of {length:,} chars: " +
+          ", ".join(f"{title} {length / elapsed * 10 ** 6:,.0f} chars/s" for title, elapsed in results.items()))
+
+
+def bench_bulk(count: int = 1000):
+    client = hw7.app.test_client()
+    single = measure(lambda: client.get("/random?length=42&specials=1&digits=0"), count) * count
+    bulk = measure(lambda: client.get(f"/random/bulk?count={count}&length=42&specials=1&digits=0").data, 20)
+    print(f"{count} sequences of 42 chars: {count} /random pages {single / 1000:.1f} ms, "
+          f"one /random/bulk request {bulk / 1000:.2f} ms")
+
+
+def bench_metrics(repeat: int = 100_000):
+    def plain_app(environ, start_response):
+        start_response("200 OK", [("Content-Type", "text/plain")])
+        return [b"ok"]
+
+    def call(app):
+        body = app({"PATH_INFO": "/whoami"}, lambda *args: None)
+        b"".join(body)
+        getattr(body, "close", lambda: None)()
+
+    measured_app = hw7.METRICS.middleware(plain_app)
+    before, after = measure(lambda: call(plain_app), repeat), measure(lambda: call(measured_app), repeat)
+    record = measure(lambda: hw7.METRICS.record("/whoami", 200, 2643, 0.0004, 0.00007), repeat)
+    print(f"metrics: record {record:.2f} us, the middleware adds {after - before:.2f} us per request")
+
+
+def bench_prefork(workers: Tuple[int, ...] = (1, 2, 4), clients: int = 8, requests: int = 4000,
+                  url: str = "/random?length=42&specials=1&digits=0", port: int = 5099):
+    """
+    Load test of serve.py: requests per second with more and more workers, clients keep their connections
+    """
+    print(f"{url} with {clients} keep-alive clients, {requests} requests, {os.cpu_count()} cores")
+    for amount in workers:
+        line = loadtest.bench_server(loadtest.HERE, "hw7:app", [url], requests, clients, amount, port, 0)[url]
+        print(f"{amount} workers: {line['rps']:,.0f} requests/s, p99 {line['p99_ms']:.2f} ms, "
+              f"{line['reconnects']} reconnects")
+
+
+def main():
+    bench_render()
+    bench_whoami()
+    bench_compression()
+    bench_routes()
+    bench_source_code()
+    bench_sequence()
+    bench_bulk()
+    bench_metrics()
+    if "--prefork" in sys.argv:
+        bench_prefork()
+
+
+if __name__ == "__main__":
+    main()
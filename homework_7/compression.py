@@ -0,0 +1,158 @@
+import gzip
+import time
+import zlib
+import struct
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from flask import Response, request
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+MIN_SIZE: int = 1024
+# smaller dynamic values are stored in the stream as they are, compressing them costs more than it saves
+STORE_BELOW: int = 512
+# codings of dynamic responses in the order of preference, gzip and deflate are spliced from ready blocks
+CODINGS: Tuple[str, ...] = ("gzip", "deflate", "br") if brotli is not None else ("gzip", "deflate")
+COMPRESSIBLE: Tuple[str, ...] = ("text/", "application/json", "application/javascript", "application/x-ndjson")
+# empty last block, it ends a stream of flushed blocks
+_FINAL_BLOCK: bytes = b"\x03\x00"
+_GZIP_HEADER: bytes = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\x03"
+_ZLIB_HEADER: bytes = b"\x78\x9c"
+
+
+def compress_variants(body: bytes) -> Dict[str, bytes]:
+    """
+    Compresses a page once with the strongest settings, it is then sent many times
+    :param body: page
+    :return: compressed page for each supported content coding
+    """
+    variants = {"gzip": gzip.compress(body, 9, mtime=0)}
+    if brotli is not None:
+        variants["br"] = brotli.compress(body, quality=11)
+    variants["deflate"] = zlib.compress(body, 9)
+    return variants
+
+
+def deflate_block(data: bytes, level: int = 6) -> bytes:
+    """
+    Raw deflate blocks that end on a byte boundary and refer to nothing before them,
+    blocks made by different calls can be joined into one stream
+    :param data: bytes to compress
+    :param level: zlib compression level
+    :return: compressed blocks, empty for empty data
+    """
+    if not data:
+        return b""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+
+def value_block(data: bytes, level: int = 6) -> bytes:
+    """
+    :param data: dynamic part of a page
+    :param level: zlib compression level for long values
+    :return: deflate blocks of the value, a stored block for short values
+    """
+    if len(data) >= STORE_BELOW:
+        return deflate_block(data, level)
+    if not data:
+        return b""
+    return b"\x00" + struct.pack("<HH", len(data), len(data) ^ 0xFFFF) + data
+
+
+def splice(coding: str, blocks: Iterable[bytes], pieces: Iterable[bytes]) -> bytes:
+    """
+    Wraps joined deflate blocks into a gzip or zlib (http "deflate") stream
+    :param coding: gzip or deflate
+    :param blocks: results of deflate_block
+    :param pieces: the uncompressed bytes of the blocks, for the checksum
+    :return: body for the Content-Encoding
+    """
+    if coding == "gzip":
+        check, size = 0, 0
+        for piece in pieces:
+            check = zlib.crc32(piece, check)
+            size += len(piece)
+        return b"".join((_GZIP_HEADER, *blocks, _FINAL_BLOCK, struct.pack("<II", check, size & 0xFFFFFFFF)))
+    check = 1
+    for piece in pieces:
+        check = zlib.adler32(piece, check)
+    return b"".join((_ZLIB_HEADER, *blocks, _FINAL_BLOCK, struct.pack(">I", check)))
+
+
+def compress(coding: str, body: bytes, level: int = 6) -> bytes:
+    """
+    :return: the whole body compressed for the Content-Encoding
+    """
+    if coding == "gzip":
+        return gzip.compress(body, level, mtime=0)
+    if coding == "deflate":
+        return zlib.compress(body, level)
+    return brotli.compress(body, quality=min(level, 11))
+
+
+class Compressor:
+    """
+    Content negotiation and compression of responses: template pages are spliced from the blocks
+    of their static chunks compressed at startup, the other responses are compressed whole after the view
+    """
+
+    def __init__(self, threshold: int = MIN_SIZE, level: int = 6,
+                 on_render: Optional[Callable[[float], None]] = None):
+        """
+        :param threshold: smaller bodies are sent as they are, the headers would eat the gain
+        :param level: compression level of the dynamic parts
+        :param on_render: receives the seconds spent rendering and compressing a page
+        """
+        self._threshold = threshold
+        self._level = level
+        self._on_render = on_render
+
+    def coding(self, size: int, codings: Tuple[str, ...] = CODINGS) -> Optional[str]:
+        """
+        :param size: bytes of the body
+        :return: content coding accepted by the client or None to send the body as it is
+        """
+        if size < self._threshold:
+            return None
+        return request.accept_encodings.best_match(codings, default=None)
+
+    def page(self, template, **values) -> Response:
+        """
+        Renders a PageTemplate compressed for the client
+        :param template: page with the compressed static chunks
+        :param values: value for each slot
+        :return: response
+        """
+        start = time.perf_counter()
+        coding = self.coding(template.size, ("gzip", "deflate"))
+        if coding is None:
+            response = Response(template.render(**values), mimetype="text/html")
+        else:
+            response = Response(template.render_encoded(coding, self._level, **values), mimetype="text/html")
+            response.headers["Content-Encoding"] = coding
+        response.vary.add("Accept-Encoding")
+        if self._on_render is not None:
+            self._on_render(time.perf_counter() - start)
+        return response
+
+    def compress_response(self, response: Response) -> Response:
+        """
+        after_request handler for the responses not compressed by the view
+        """
+        if (response.status_code < 200 or response.status_code in (204, 304) or response.direct_passthrough
+                or response.is_streamed or "Content-Encoding" in response.headers
+                or not (response.mimetype or "").startswith(COMPRESSIBLE)):
+            return response
+        body = response.get_data()
+        coding = self.coding(len(body))
+        response.vary.add("Accept-Encoding")
+        if coding is not None:
+            response.set_data(compress(coding, body, self._level))
+            response.headers["Content-Encoding"] = coding
+        return response
+
@@ -0,0 +1,276 @@
+import os
+import sys
+import json
+import time
+import random
+import socket
+import platform
+import argparse
+import importlib.metadata
+import statistics
+import subprocess
+import http.client
+from multiprocessing import Pool
+from typing import Dict, List, Optional, Tuple
+
+import serve
+
+
+HERE: str = os.path.dirname(os.path.abspath(__file__))
+# homework folder and application of each suite
+APPS: Dict[str, Tuple[str, str]] = {
+    "hw4": (os.path.join(HERE, "..", "homework_4"), "hw4:app"),
+    "hw6": (os.path.join(HERE, "..", "homework_6"), "hw4hw6:app"),
+    "hw7": (HERE, "hw7:app"),
+}
+# parameters of /random as the test-data jobs send them
+RANDOM_MIX: Tuple[str, ...] = (
+    "length=42&specials=1&digits=0",
+    "length=8&specials=0&digits=1",
+    "length=16&specials=1&digits=1",
+    "length=100&specials=1&digits=1",
+    "length=1",
+    "length=101",
+    "length=abc&specials=1",
+)
+BULK_MIX: Tuple[str, ...] = ("count=100&length=42&specials=1&digits=0", "count=1000&length=16&format=json")
+REGRESSION: float = 0.10
+
+
+def routes(app) -> List[str]:
+    """
+    :param app: flask application
+    :return: urls of every GET route, /random with each parameter mix
+    """
+    urls: List[str] = []
+    for rule in sorted(app.url_map.iter_rules(), key=lambda rule: rule.rule):
+        if rule.arguments or "GET" not in rule.methods or rule.endpoint == "static":
+            continue
+        if rule.rule == "/random":
+            urls += [f"/random?{query}" for query in RANDOM_MIX]
+        elif rule.rule == "/random/bulk":
+            urls += [f"/random/bulk?{query}" for query in BULK_MIX]
+        elif rule.rule == "/random/stream":
+            urls.append("/random/stream?length=1000000&specials=1&digits=1")
+        else:
+            urls.append(rule.rule)
+    return urls
+
+
+def summary(latencies: List[float], seconds: float) -> Dict[str, float]:
+    """
+    :param latencies: seconds of each request
+    :param seconds: wall time of the run
+    :return: requests per second and percentiles in milliseconds
+    """
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive") if len(latencies) > 1 else latencies * 99
+    return {
+        "requests": len(latencies),
+        "rps": round(len(latencies) / seconds, 1),
+        "p50_ms": round(cuts[49] * 1000, 4),
+        "p95_ms": round(cuts[94] * 1000, 4),
+        "p99_ms": round(cuts[98] * 1000, 4),
+    }
+
+
+def load_app(directory: str, spec: str):
+    """
+    The homework apps read their own files by relative names, so the run happens in their folder
+    """
+    os.chdir(directory)
+    return serve.load_app(spec)
+
+
+def bench_client(app, urls: List[str], requests: int, warmup: int) -> Dict[str, Dict[str, float]]:
+    """
+    Pure application cost: every route through the flask test client, no sockets
+    :param requests: requests per route
+    :param warmup: requests per route that are not measured
+    """
+    client = app.test_client()
+    results: Dict[str, Dict[str, float]] = {}
+    for url in urls:
+        for _ in range(warmup):
+            client.get(url).close()
+        latencies: List[float] = []
+        started = time.perf_counter()
+        for _ in range(requests):
+            start = time.perf_counter()
+            response = client.get(url)
+            response.get_data()
+            response.close()
+            latencies.append(time.perf_counter() - start)
+        results[url] = summary(latencies, time.perf_counter() - started)
+    return results
+
+
+def keep_alive_client(arguments: Tuple[int, List[str], int]) -> Tuple[List[float], int]:
+    """
+    One client process, sends its urls over one connection kept alive as long as the server allows;
+    from Werkzeug 2.1 on the server closes it after every response and http.client opens a new one
+    :param arguments: port, urls in the order to send, requests
+    :return: seconds of each request, requests that had to open a new connection
+    """
+    port, urls, requests = arguments
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+    latencies: List[float] = []
+    closed = 0
+    for number in range(requests):
+        start = time.perf_counter()
+        connection.request("GET", urls[number % len(urls)])
+        response = connection.getresponse()
+        response.read()
+        latencies.append(time.perf_counter() - start)
+        if (response.getheader("Connection") or "").lower() == "close":
+            closed += 1
+    connection.close()
+    # the connection closed by the last response is not opened again
+    return latencies, min(closed, max(requests - 1, 0))
+
+
+def client_summary(parts: List[Tuple[List[float], int]], seconds: float) -> Dict[str, float]:
+    """
+    :param parts: results of keep_alive_client
+    :param seconds: wall time of the run
+    :return: summary with the number of reconnects
+    """
+    line = summary([latency for latencies, _ in parts for latency in latencies], seconds)
+    line["reconnects"] = sum(reconnects for _, reconnects in parts)
+    return line
+
+
+def wait_for_server(port: int, attempts: int = 100):
+    for _ in range(attempts):
+        try:
+            socket.create_connection(("127.0.0.1", port), 1).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"Nothing listens on port {port}")
+
+
+def bench_server(directory: str, spec: str, urls: List[str], requests: int, clients: int, workers: int,
+                 port: int, seed: int) -> Dict[str, Dict[str, float]]:
+    """
+    End to end: serve.py in its own process, clients in their own processes.
+    "reconnects" counts the requests sent over a new connection, it is not 0 when the server does not keep alive
+    :param requests: requests per route, split between the clients
+    :param seed: order of the urls of each client, the same seed gives the same run
+    """
+    server = subprocess.Popen([sys.executable, os.path.join(HERE, "serve.py"), spec, "--host", "127.0.0.1",
+                               "--port", str(port), "--workers", str(workers)],
+                              cwd=directory, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    results: Dict[str, Dict[str, float]] = {}
+    try:
+        wait_for_server(port)
+        per_client = max(1, requests // clients)
+        with Pool(clients) as pool:
+            for url in urls:
+                pool.map(keep_alive_client, [(port, [url], 10)] * clients)
+                started = time.perf_counter()
+                parts = pool.map(keep_alive_client, [(port, [url], per_client)] * clients)
+                results[url] = client_summary(parts, time.perf_counter() - started)
+            mixed = [url for url in urls if url.startswith("/random?")]
+            if mixed:
+                orders = [random.Random(seed + number).sample(mixed, len(mixed)) for number in range(clients)]
+                started = time.perf_counter()
+                parts = pool.map(keep_alive_client, [(port, order, per_client) for order in orders])
+                results["/random mix"] = client_summary(parts, time.perf_counter() - started)
+    finally:
+        server.terminate()
+        server.wait()
+    return results
+
+
+def compare(previous: dict, current: dict, threshold: float = REGRESSION) -> List[str]:
+    """
+    :return: lines about routes that got slower than the threshold, p95 up or requests per second down
+    """
+    regressions: List[str] = []
+    for suite, modes in current["suites"].items():
+        for mode, urls in modes.items():
+            for url, now in urls.items():
+                before = previous.get("suites", {}).get(suite, {}).get(mode, {}).get(url)
+                if not before:
+                    continue
+                if now["p95_ms"] > before["p95_ms"] * (1 + threshold):
+                    regressions.append(f"{suite} {mode} {url}: p95 {before['p95_ms']} -> {now['p95_ms']} ms")
+                if now["rps"] < before["rps"] * (1 - threshold):
+                    regressions.append(f"{suite} {mode} {url}: {before['rps']} -> {now['rps']} requests/s")
+    return regressions
+
+
+def print_results(results: dict):
+    for suite, modes in results["suites"].items():
+        for mode, urls in modes.items():
+            print(f"{suite} {mode}")
+            for url, line in urls.items():
+                print(f"    {url:55} {line['rps']:>10,.1f} rps  p50 {line['p50_ms']:8.3f}  "
+                      f"p95 {line['p95_ms']:8.3f}  p99 {line['p99_ms']:8.3f} ms"
+                      + (f"  {line['reconnects']} reconnects" if line.get("reconnects") else ""))
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Load test of the routes of homework 4, 6 and 7")
+    parser.add_argument("suites", nargs="*", help=f"some of {', '.join(APPS)}, all of them by default")
+    parser.add_argument("--mode", choices=("client", "server", "both"), default="both")
+    parser.add_argument("--requests", type=int, default=500, help="requests per route")
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--clients", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--port", type=int, default=5098)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", help="write the results to this json file")
+    parser.add_argument("--compare", help="json file of an earlier run, regressions make the exit code 1")
+    parser.add_argument("--threshold", type=float, default=REGRESSION)
+    options = parser.parse_args(arguments)
+    unknown = set(options.suites) - set(APPS)
+    if unknown:
+        parser.error(f"Unknown suites: {', '.join(sorted(unknown))}")
+    random.seed(options.seed)
+    # the suites change the working directory
+    output = os.path.abspath(options.output) if options.output else None
+    previous = os.path.abspath(options.compare) if options.compare else None
+
+    results: dict = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "environment": {"python": platform.python_version(), "platform": platform.platform(),
+                        "cpus": os.cpu_count(), "werkzeug": importlib.metadata.version("werkzeug"),
+                        "flask": importlib.metadata.version("flask")},
+        "settings": {key: value for key, value in vars(options).items() if key not in ("output", "compare")},
+        "suites": {},
+    }
+    for suite in options.suites or APPS:
+        directory, spec = APPS[suite]
+        directory = os.path.abspath(directory)
+        app = load_app(directory, spec)
+        urls = routes(app)
+        modes = results["suites"][suite] = {}
+        if options.mode in ("client", "both"):
+            modes["client"] = bench_client(app, urls, options.requests, options.warmup)
+        if options.mode in ("server", "both"):
+            modes["server"] = bench_server(directory, spec, urls, options.requests, options.clients,
+                                           options.workers, options.port, options.seed)
+    print_results(results)
+
+    if output:
+        with open(output, "w") as f:
+            json.dump(results, f, indent=2)
+    if previous:
+        with open(previous) as f:
+            earlier = json.load(f)
+        for package in ("werkzeug", "flask"):
+            before, now = earlier.get("environment", {}).get(package), results["environment"][package]
+            if before != now:
+                print(f"WARNING: {package} {before} in {options.compare}, {now} now, "
+                      f"the server numbers are not comparable", file=sys.stderr)
+        regressions = compare(earlier, results, options.threshold)
+        for line in regressions:
+            print(f"Regression: {line}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
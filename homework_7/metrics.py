@@ -0,0 +1,226 @@
+import os
+import sys
+import zlib
+import mmap
+import time
+import struct
+import atexit
+import shutil
+import tempfile
+import threading
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from flask import has_request_context, request
+
+
+# upper bounds of the latency buckets in seconds, the last bucket is +Inf
+BUCKETS: Tuple[float, ...] = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+STATUS_CLASSES: Tuple[str, ...] = ("1xx", "2xx", "3xx", "4xx", "5xx")
+OTHER_ROUTE: str = "other"
+RENDER_KEY: str = "metrics.render_seconds"
+# beginning of every file: checksum of the layout and the number of slots
+_HEADER = struct.Struct("<QQ")
+
+
+class Metrics:
+    """
+    Per-route counters and latency histograms.
+    Each process writes its own file of float64 slots in a shared directory, /metrics sums the files,
+    so the numbers of all prefork workers add up without locks between processes
+    """
+    # slots of one route: responses by status class, bytes out, then two histograms (buckets, +Inf, sum)
+    _HISTOGRAM = len(BUCKETS) + 2
+    _BYTES = len(STATUS_CLASSES)
+    _DURATION = _BYTES + 1
+    _RENDER = _DURATION + _HISTOGRAM
+    _ROUTE_SLOTS = _RENDER + _HISTOGRAM
+
+    def __init__(self, routes: Iterable[str], directory: Optional[str] = None, prefix: str = "hw7"):
+        """
+        :param routes: paths measured one by one, the rest are counted as "other"
+        :param directory: where the processes keep their files, METRICS_DIR or a new temporary directory;
+        it must be chosen before the workers are forked
+        :param prefix: beginning of the metric names
+        """
+        self._routes: List[str] = list(routes) + [OTHER_ROUTE]
+        self._offsets: Dict[str, int] = {route: number * self._ROUTE_SLOTS for number, route in enumerate(self._routes)}
+        self._size = len(self._routes) * self._ROUTE_SLOTS
+        # the offsets follow the order of the routes, a file written for another list means other counters
+        layout = zlib.crc32("\n".join(self._routes + [repr(BUCKETS), repr(STATUS_CLASSES)]).encode())
+        self._header = _HEADER.pack(layout, self._size)
+        self._skipped: Set[str] = set()
+        self._prefix = prefix
+        self._directory = directory or os.environ.get("METRICS_DIR") or self._temporary_directory()
+        self._lock = threading.Lock()
+        self._pid = 0
+        self._slots: Optional[memoryview] = None
+
+    @staticmethod
+    def _temporary_directory() -> str:
+        directory = tempfile.mkdtemp(prefix="metrics-")
+        owner = os.getpid()
+        # forked workers leave with os._exit, only the process that made the directory removes it
+        atexit.register(lambda: os.getpid() == owner and shutil.rmtree(directory, ignore_errors=True))
+        return directory
+
+    def _own_slots(self) -> memoryview:
+        """
+        :return: slots of the current process, the file is made on the first request after fork
+        """
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    file_name = os.path.join(self._directory, f"{os.getpid()}.metrics")
+                    file_size = _HEADER.size + self._size * 8
+                    # a file left by a dead worker with the same pid or by an earlier run keeps its counters,
+                    # the new process adds to them, so the sums never go back; a file of another layout starts anew
+                    descriptor = os.open(file_name, os.O_RDWR | os.O_CREAT, 0o644)
+                    try:
+                        if (os.fstat(descriptor).st_size != file_size
+                                or os.pread(descriptor, _HEADER.size, 0) != self._header):
+                            os.ftruncate(descriptor, 0)
+                            os.ftruncate(descriptor, file_size)
+                            os.pwrite(descriptor, self._header, 0)
+                        self._slots = memoryview(mmap.mmap(descriptor, file_size))[_HEADER.size:].cast("d")
+                    finally:
+                        os.close(descriptor)
+                    self._pid = os.getpid()
+        return self._slots  # type: ignore
+
+    def _observe(self, slots: memoryview, start: int, seconds: float):
+        slots[start + bisect_left(BUCKETS, seconds)] += 1
+        slots[start + len(BUCKETS) + 1] += seconds
+
+    def record(self, route: str, status: int, sent: int, seconds: float, render_seconds: Optional[float] = None):
+        """
+        :param route: path of the request
+        :param status: http status code
+        :param sent: bytes of the body
+        :param seconds: from the start of the request to the last byte
+        :param render_seconds: time spent rendering the page, None if nothing was rendered
+        """
+        offset = self._offsets.get(route, self._offsets[OTHER_ROUTE])
+        slots = self._own_slots()
+        with self._lock:
+            slots[offset + min(max(status // 100, 1), 5) - 1] += 1
+            slots[offset + self._BYTES] += sent
+            self._observe(slots, offset + self._DURATION, seconds)
+            if render_seconds is not None:
+                self._observe(slots, offset + self._RENDER, render_seconds)
+
+    def render(self, template, **values) -> bytes:
+        """
+        Renders a PageTemplate and adds the time to the current request
+        :return: page
+        """
+        start = time.perf_counter()
+        page = template.render(**values)
+        self.add_render_time(time.perf_counter() - start)
+        return page
+
+    @staticmethod
+    def add_render_time(seconds: float):
+        if not has_request_context():
+            return
+        environ = request.environ
+        environ[RENDER_KEY] = environ.get(RENDER_KEY, 0.0) + seconds
+
+    def middleware(self, wsgi_app: Callable) -> Callable:
+        """
+        Wraps app.wsgi_app, the time and the bytes are counted until the body is sent, streamed bodies included
+        """
+        def measured_app(environ, start_response):
+            start = time.perf_counter()
+            status: List[int] = [0]
+
+            def measured_start_response(status_line, headers, exc_info=None):
+                status[0] = int(status_line[:3])
+                return start_response(status_line, headers, exc_info)
+
+            def finish(sent: int):
+                self.record(environ.get("PATH_INFO", ""), status[0], sent, time.perf_counter() - start,
+                            environ.get(RENDER_KEY))
+
+            return MeasuredBody(wsgi_app(environ, measured_start_response), finish)
+        return measured_app
+
+    def collect(self) -> List[float]:
+        """
+        :return: slots summed over the files of all processes
+        """
+        total = [0.0] * self._size
+        for file_name in os.listdir(self._directory):
+            if not file_name.endswith(".metrics"):
+                continue
+            with open(os.path.join(self._directory, file_name), "rb") as f:
+                data = f.read()
+            if len(data) != _HEADER.size + self._size * 8 or data[:_HEADER.size] != self._header:
+                if file_name not in self._skipped:
+                    self._skipped.add(file_name)
+                    print(f"Skipping {file_name}: written for another list of routes", file=sys.stderr)
+                continue
+            for number, value in enumerate(memoryview(data)[_HEADER.size:].cast("d")):
+                total[number] += value
+        return total
+
+    def _histogram(self, name: str, route: str, slots: List[float]) -> Iterator[str]:
+        count = 0.0
+        for bound, value in zip(BUCKETS + (float("inf"),), slots):
+            count += value
+            yield f'{name}_bucket{{route="{route}",le="{"+Inf" if bound == float("inf") else bound}"}} {count:.0f}'
+        yield f'{name}_sum{{route="{route}"}} {slots[len(BUCKETS) + 1]!r}'
+        yield f'{name}_count{{route="{route}"}} {count:.0f}'
+
+    def exposition(self) -> str:
+        """
+        :return: all metrics in the Prometheus text format
+        """
+        total = self.collect()
+        requests, sent = f"{self._prefix}_requests_total", f"{self._prefix}_response_bytes_total"
+        duration, render = f"{self._prefix}_request_duration_seconds", f"{self._prefix}_render_duration_seconds"
+        lines = [f"# HELP {requests} Answered requests by route and status class",
+                 f"# TYPE {requests} counter"]
+        for route, offset in self._offsets.items():
+            for number, status_class in enumerate(STATUS_CLASSES):
+                if total[offset + number]:
+                    lines.append(f'{requests}{{route="{route}",code="{status_class}"}} {total[offset + number]:.0f}')
+        lines += [f"# HELP {sent} Bytes of response bodies", f"# TYPE {sent} counter"]
+        lines += [f'{sent}{{route="{route}"}} {total[offset + self._BYTES]:.0f}' for route, offset in self._offsets.items()]
+        for name, start, title in ((duration, self._DURATION, "Time from the request to the last byte sent"),
+                                   (render, self._RENDER, "Time spent rendering pages")):
+            lines += [f"# HELP {name} {title}", f"# TYPE {name} histogram"]
+            for route, offset in self._offsets.items():
+                lines.extend(self._histogram(name, route, total[offset + start:offset + start + self._HISTOGRAM]))
+        return "\n".join(lines) + "\n"
+
+
+class MeasuredBody:
+    """
+    Response body that counts its bytes and reports once, after the last chunk or when it is closed
+    """
+    __slots__ = ("_body", "_finish", "_sent")
+
+    def __init__(self, body: Iterable[bytes], finish: Callable[[int], None]):
+        self._body = body
+        self._finish: Optional[Callable[[int], None]] = finish
+        self._sent = 0
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._body:
+            self._sent += len(chunk)
+            yield chunk
+        self._report()
+
+    def _report(self):
+        finish, self._finish = self._finish, None
+        if finish is not None:
+            finish(self._sent)
+
+    def close(self):
+        try:
+            close = getattr(self._body, "close", None)
+            if close is not None:
+                close()
+        finally:
+            self._report()
@@ -0,0 +1,104 @@
+import os
+import time
+import hashlib
+import threading
+from functools import wraps
+from typing import Callable, Dict, Iterable, NamedTuple, Optional, Tuple, Union
+
+from flask import Response, request
+
+from compression import compress_variants
+
+
+class CachedPage(NamedTuple):
+    body: bytes
+    etag: str
+    last_modified: int
+    version: Tuple[int, ...]
+    encoded: Dict[str, bytes]
+
+
+class PageCache:
+    """
+    Keeps rendered static pages with ETag and Last-Modified,
+    a page is rendered again when one of the source files changes
+    """
+
+    def __init__(self, source_files: Iterable[str], check_interval: float = 1.0):
+        """
+        :param source_files: files the pages are made of
+        :param check_interval: the files are checked no more often than once in this many seconds
+        """
+        self._source_files = [os.path.abspath(name) for name in source_files]
+        self._check_interval = check_interval
+        self._checked_at = 0.0
+        self._version: Tuple[int, ...] = ()
+        self._pages: Dict[str, CachedPage] = {}
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = {"hits": 0, "misses": 0, "not_modified": 0}
+
+    def _source_version(self) -> Tuple[int, ...]:
+        now = time.monotonic()
+        if now - self._checked_at >= self._check_interval:
+            self._version = tuple(os.stat(name).st_mtime_ns for name in self._source_files)
+            self._checked_at = now
+        return self._version
+
+    def _count(self, counter: str):
+        with self._lock:
+            self._counters[counter] += 1
+
+    def page(self, name: str, render: Callable[[], Union[str, bytes]]) -> CachedPage:
+        """
+        :param name: key of the page
+        :param render: makes the page if it is not cached or the sources have changed
+        :return: rendered page
+        """
+        version = self._source_version()
+        cached: Optional[CachedPage] = self._pages.get(name)
+        if cached is not None and cached.version == version:
+            self._count("hits")
+            return cached
+        self._count("misses")
+        rendered = render()
+        body = rendered.encode() if isinstance(rendered, str) else rendered
+        cached = CachedPage(body, hashlib.sha1(body).hexdigest(), max(version) // 10 ** 9, version,
+                            compress_variants(body))
+        with self._lock:
+            self._pages[name] = cached
+        return cached
+
+    def cached(self, view: Callable[[], Union[str, bytes]]) -> Callable[[], Response]:
+        """
+        decorator for views without parameters, answers 304 when the client already has the page,
+        sends the pre-compressed page if the client accepts it
+        """
+        @wraps(view)
+        def wrapper() -> Response:
+            cached = self.page(view.__name__, view)
+            coding = request.accept_encodings.best_match(list(cached.encoded), default=None)
+            if coding is None:
+                response = Response(cached.body, mimetype="text/html")
+                response.set_etag(cached.etag)
+            else:
+                response = Response(cached.encoded[coding], mimetype="text/html")
+                response.headers["Content-Encoding"] = coding
+                response.set_etag(f"{cached.etag}-{coding}")
+            response.vary.add("Accept-Encoding")
+            response.last_modified = cached.last_modified  # type: ignore
+            response.cache_control.no_cache = True
+            response = response.make_conditional(request)
+            if response.status_code == 304:
+                self._count("not_modified")
+            return response
+        return wrapper
+
+    def stats(self) -> Dict[str, float]:
+        """
+        :return: counters and the share of requests served from the cache
+        """
+        with self._lock:
+            stats: Dict[str, float] = dict(self._counters)
+        total = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / total if total else 0.0
+        return stats
@@ -0,0 +1,76 @@
+import re
+from typing import Iterator, List, Union
+
+from markupsafe import escape
+
+from compression import deflate_block, splice, value_block
+
+
+SLOT_MARK: str = "\x00"
+_needs_escape = re.compile("[&<>\"']").search
+
+
+def slot(name: str) -> str:
+    """
+    Marks the place of a dynamic value in the page text
+    :param name: name of the value passed to render
+    :return: marker to be inserted into the text
+    """
+    return f"{SLOT_MARK}{name}{SLOT_MARK}"
+
+
+class PageTemplate:
+    """
+    A page split once into static byte chunks and named slots,
+    rendering only escapes the values and joins bytes;
+    the static chunks are also compressed once, a compressed page only compresses the values
+    """
+    __slots__ = ("_chunks", "_slots", "_blocks", "size")
+
+    def __init__(self, text: str):
+        """
+        :param text: the whole page, dynamic places are marked with slot()
+        """
+        parts: List[str] = text.split(SLOT_MARK)
+        if len(parts) % 2 == 0:
+            raise ValueError("The page has an unclosed slot")
+        self._chunks: List[bytes] = [part.encode() for part in parts[0::2]]
+        self._slots: List[str] = parts[1::2]
+        self._blocks: List[bytes] = [deflate_block(chunk, 9) for chunk in self._chunks]
+        # bytes of the page without the values
+        self.size: int = sum(map(len, self._chunks))
+
+    def _values(self, values) -> Iterator[bytes]:
+        for name in self._slots:
+            value = values[name]
+            # plain strings without special characters skip escaping
+            if type(value) is not str or _needs_escape(value):
+                value = str(escape(value))
+            yield value.encode()
+
+    def _pieces(self, values) -> List[bytes]:
+        chunks = self._chunks
+        pieces: List[bytes] = [chunks[0]]
+        for position, value in enumerate(self._values(values), 1):
+            pieces.append(value)
+            pieces.append(chunks[position])
+        return pieces
+
+    def render(self, **values: Union[str, int]) -> bytes:
+        """
+        :param values: value for each slot, escaped unless it is Markup
+        :return: page ready to be sent
+        """
+        return b"".join(self._pieces(values))
+
+    def render_encoded(self, coding: str, level: int = 6, **values: Union[str, int]) -> bytes:
+        """
+        :param coding: gzip or deflate
+        :param level: compression level of the values
+        :param values: value for each slot, escaped unless it is Markup
+        :return: compressed page, the blocks of the static chunks are only copied
+        """
+        pieces = self._pieces(values)
+        blocks = [value_block(piece, level) if position % 2 else self._blocks[position // 2]
+                  for position, piece in enumerate(pieces)]
+        return splice(coding, blocks, pieces)
@@ -0,0 +1,87 @@
+import os
+from random import randbytes
+from typing import Callable, Dict, Iterator, List, Tuple
+
+
+ALPHABET: str = "abcdefghijklmnopqrstuvwxyz"
+SPECIAL_CHARS: str = '!"№;%:?*()_+'
+NUMBERS: str = "0123456789"
+CHUNK_SIZE: int = 64 * 1024
+# every combination of the settings (specials, digits) is made once
+ALPHABETS: Dict[Tuple[bool, bool], str] = {
+    (specials, digits): ALPHABET + (SPECIAL_CHARS if specials else "") + (NUMBERS if digits else "")
+    for specials in (False, True) for digits in (False, True)
+}
+
+
+def _byte_table(alphabet: str) -> Tuple[bytes, Dict[int, str]]:
+    """
+    Table for turning random bytes into characters without modulo bias
+    :param alphabet: characters of the sequence
+    :return: bytes to be thrown away and the translation of the rest into characters
+    """
+    limit = 256 - 256 % len(alphabet)
+    return bytes(range(limit, 256)), str.maketrans({chr(byte): alphabet[byte % len(alphabet)] for byte in range(limit)})
+
+
+BYTE_TABLES: Dict[str, Tuple[bytes, Dict[int, str]]] = {alphabet: _byte_table(alphabet)
+                                                         for alphabet in ALPHABETS.values()}
+
+
+def table_sequence(length: int, alphabet: str, source: Callable[[int], bytes] = randbytes) -> str:
+    """
+    Turns random bytes into characters by the table, the work is done by bytes.translate and str.translate
+    :param length: number of characters
+    :param alphabet: one of ALPHABETS
+    :param source: random bytes: random.randbytes, or os.urandom for passwords and tokens
+    :return: random string
+    """
+    rejected, table = BYTE_TABLES[alphabet]
+    parts = []
+    while length > 0:
+        # a little more bytes than needed, some of them are thrown away
+        data = source(length + length // 4 + 16).translate(None, rejected)[:length]
+        parts.append(data.decode("latin-1").translate(table))
+        length -= len(data)
+    return "".join(parts)
+
+
+def build_sequence(length: int, specials: bool = False, digits: bool = False, secure: bool = False) -> str:
+    """
+    Generates a string of random English characters, special characters and numbers in one batch
+    :param length: number of characters
+    :param specials: add special characters
+    :param digits: add numbers
+    :param secure: use the cryptographic source instead of the random module
+    :return: random string
+    """
+    return table_sequence(length, ALPHABETS[bool(specials), bool(digits)], os.urandom if secure else randbytes)
+
+
+def stream_sequence(length: int, specials: bool = False, digits: bool = False, secure: bool = False,
+                    chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """
+    Generates a long sequence piece by piece, so it never lies in memory in full
+    :return: generator of parts of the sequence
+    """
+    while length > 0:
+        part = min(length, chunk_size)
+        yield build_sequence(part, specials, digits, secure)
+        length -= part
+
+
+def batch_sequences(count: int, length: int, specials: bool = False, digits: bool = False, secure: bool = False,
+                    chunk_size: int = CHUNK_SIZE) -> Iterator[List[str]]:
+    """
+    Many sequences of the same length, the random characters are made for a whole batch at once
+    :param count: number of sequences
+    :param length: characters in each sequence
+    :param chunk_size: about this many characters are generated at a time
+    :return: generator of lists of sequences
+    """
+    per_batch = max(1, chunk_size // length)
+    while count > 0:
+        amount = min(count, per_batch)
+        text = build_sequence(amount * length, specials, digits, secure)
+        yield [text[start:start + length] for start in range(0, amount * length, length)]
+        count -= amount
@@ -0,0 +1,219 @@
+import gc
+import os
+import sys
+import time
+import signal
+import socket
+import argparse
+import importlib
+import importlib.metadata
+from typing import Callable, Dict, List, Optional, Tuple
+
+from werkzeug.serving import ThreadedWSGIServer, WSGIRequestHandler
+
+
+# the homework_6 image carries this same file and sets APP to its own application
+DEFAULT_APP: str = os.environ.get("APP", "hw7:app")
+
+
+def werkzeug_version() -> Tuple[int, ...]:
+    """
+    :return: major and minor version of the installed werkzeug
+    """
+    return tuple(int(part) for part in importlib.metadata.version("werkzeug").split(".")[:2] if part.isdecimal())
+
+
+# from 2.1 on WSGIRequestHandler sends "Connection: close" with every response
+KEEP_ALIVE_SUPPORTED: bool = werkzeug_version() < (2, 1)
+
+
+class KeepAliveHandler(WSGIRequestHandler):
+    """
+    HTTP/1.1 handler, a connection stays open for the next request until it is idle for timeout seconds.
+    Only with the pinned Werkzeug 2.0.x, newer versions close the connection after each response
+    """
+    protocol_version = "HTTP/1.1"
+    timeout = 5
+    # the headers and the body are separate writes, with Nagle the body waits for the delayed ack
+    disable_nagle_algorithm = True
+    access_log = False
+
+    def log_request(self, *args, **kwargs):
+        if self.access_log:
+            super().log_request(*args, **kwargs)
+
+
+def load_app(spec: str) -> Callable:
+    """
+    Imports the application once in the main process, the workers get it with fork
+    :param spec: "module:variable", for example hw7:app
+    :return: wsgi application
+    """
+    module_name, _, name = spec.partition(":")
+    # the app may live next to the working directory, not next to this file
+    if os.getcwd() not in sys.path:
+        sys.path.insert(0, os.getcwd())
+    return getattr(importlib.import_module(module_name), name or "app")
+
+
+def listen(host: str, port: int, backlog: int) -> socket.socket:
+    """
+    The listening socket is made before fork, all workers accept from it
+    :param backlog: length of the queue of connections not yet accepted
+    :return: listening socket
+    """
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def run_worker(app: Callable, sock: socket.socket, keep_alive: float, access_log: bool = False):
+    """
+    Serves requests in a forked process until SIGTERM, each connection gets a thread
+    :param keep_alive: seconds an idle connection is kept open
+    :param access_log: print a line per request
+    """
+    handler = type("WorkerHandler", (KeepAliveHandler,), {"timeout": keep_alive, "access_log": access_log})
+    host, port = sock.getsockname()[:2]
+    server = ThreadedWSGIServer(host, port, app, handler=handler, fd=sock.fileno())
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+
+class PreforkServer:
+    """
+    Loads the application, then forks the workers; they share its memory copy-on-write.
+    A worker that dies is started again
+    """
+
+    def __init__(self, app: Callable, host: str = "0.0.0.0", port: int = 5000, workers: Optional[int] = None,
+                 backlog: int = 2048, keep_alive: float = 5.0, access_log: bool = False):
+        """
+        :param workers: number of processes, one per core by default
+        :param backlog: length of the queue of connections not yet accepted
+        :param keep_alive: seconds an idle connection is kept open
+        :param access_log: print a line per request
+        """
+        self._app = app
+        self._host = host
+        self._port = port
+        self._workers = workers or os.cpu_count() or 1
+        self._backlog = backlog
+        self._keep_alive = keep_alive
+        self._access_log = access_log
+        self._sock: Optional[socket.socket] = None
+        self._children: Dict[int, int] = {}
+        self._running = False
+
+    @property
+    def port(self) -> int:
+        return self._sock.getsockname()[1] if self._sock is not None else self._port
+
+    def _spawn(self, number: int):
+        stop_signals = {signal.SIGTERM, signal.SIGINT}
+        # the signals wait until the child has dropped the handlers of the master
+        signal.pthread_sigmask(signal.SIG_BLOCK, stop_signals)
+        try:
+            pid = os.fork()
+        except OSError:
+            signal.pthread_sigmask(signal.SIG_UNBLOCK, stop_signals)
+            raise
+        if pid == 0:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            self._children.clear()
+            signal.pthread_sigmask(signal.SIG_UNBLOCK, stop_signals)
+            code = 0
+            try:
+                run_worker(self._app, self._sock, self._keep_alive, self._access_log)  # type: ignore
+            except SystemExit as error:
+                code = error.code or 0
+            except BaseException:
+                code = 1
+            finally:
+                os._exit(code)
+        self._children[pid] = number
+        signal.pthread_sigmask(signal.SIG_UNBLOCK, stop_signals)
+
+    def start(self):
+        """
+        Binds the socket and forks the workers, returns at once
+        """
+        self._sock = listen(self._host, self._port, self._backlog)
+        self._running = True
+        # objects made at import are not touched by the collector, so their pages stay shared
+        gc.freeze()
+        for number in range(self._workers):
+            self._spawn(number)
+
+    def stop(self, *_):
+        self._running = False
+        for pid in list(self._children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        while self._children:
+            try:
+                pid, _ = os.wait()
+            except ChildProcessError:
+                # supervise reaped a worker but was interrupted before it forgot the pid
+                self._children.clear()
+                break
+            self._children.pop(pid, None)
+        if self._sock is not None:
+            self._sock.close()
+
+    def supervise(self):
+        """
+        Waits for the workers and restarts the dead ones until SIGTERM or SIGINT
+        """
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        while self._running:
+            try:
+                pid, _ = os.wait()
+            except ChildProcessError:
+                break
+            number = self._children.pop(pid, None)
+            if self._running and number is not None:
+                print(f"Worker {pid} died, starting a new one", file=sys.stderr)
+                time.sleep(0.1)
+                self._spawn(number)
+
+    def workers(self) -> List[int]:
+        return list(self._children)
+
+
+def main(arguments: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Prefork server for the Flask homework apps")
+    parser.add_argument("app", nargs="?", default=DEFAULT_APP, help="module:variable, default %(default)s")
+    parser.add_argument("--host", default=os.environ.get("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", 5000)))
+    parser.add_argument("--workers", type=int, default=int(os.environ.get("WORKERS", 0)),
+                        help="number of processes, one per core by default")
+    parser.add_argument("--backlog", type=int, default=int(os.environ.get("BACKLOG", 2048)))
+    parser.add_argument("--keep-alive", type=float, default=float(os.environ.get("KEEP_ALIVE", 5)),
+                        help="seconds an idle connection is kept open, only with the pinned Werkzeug 2.0.x: "
+                             "from 2.1 on every response closes the connection")
+    parser.add_argument("--access-log", action="store_true", help="print a line per request")
+    options = parser.parse_args(arguments)
+    if not KEEP_ALIVE_SUPPORTED:
+        print(f"WARNING: Werkzeug {'.'.join(map(str, werkzeug_version()))} closes the connection after every "
+              f"response, --keep-alive has no effect; install the pinned Werkzeug 2.0.x", file=sys.stderr)
+    server = PreforkServer(load_app(options.app), options.host, options.port, options.workers or None,
+                           options.backlog, options.keep_alive, options.access_log)
+    server.start()
+    print(f"Serving {options.app} on {options.host}:{server.port} with {len(server.workers())} workers")
+    server.supervise()
+
+
+if __name__ == "__main__":
+    main()